@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
-import json
-from collections import defaultdict
 from pathlib import Path
 from typing import Any, Iterable, Mapping
 
+from utils import fastjson
 
+# Constant parts of every mapping, spread into the per-block/per-variant dicts
+_MAT_TEMPLATE = {"render_method": "alpha_test"}
+_BLOCK_SKELETON = {
+    "included_in_creative_inventory": False,
+    "only_override_states": True,
+    "place_air": True,
+}
 
-def write_geyser_block_mappings(entries: dict[str, list[dict[str, str]]], output_path: Path) -> None:
+
+def write_geyser_block_mappings(
+    entries: dict[str, list[dict[str, str]]],
+    output_path: Path,
+    pretty: bool = False,
+) -> None:
     """
     Emit geyser_mappings.json compatible with Geyser's custom item definitions.
 
@@ -17,41 +28,30 @@ def write_geyser_block_mappings(entries: dict[str, list[dict[str, str]]], output
         entries: Iterable of config dictionaries containing at minimum 
                  `item`, `path_hash`, `generated`, `bedrock_icon`, and `nbt`.
         output_path: Destination JSON file (typically `target/geyser_mappings.json`).
+        pretty: Indent the JSON output for debugging. Geyser does not need it.
 
     Returns:
         None. Writes the mappings file to disk.
     """
-    mappings: dict[str, dict[str, Any]] = defaultdict(dict)
-    for block_type, variant_list in entries.items():
-        variants: dict[str, Any] = {}
-        for block_variant_index, entry in enumerate(variant_list):
-            variant_key = entry.get("variant")
-            if not variant_key:
-                continue
-            if "note=0" in variant_key:
-                variant_key = variant_key.replace("note=0", "note=24")
-            geometry = entry.get("geometry", "cube_all")
-            texture_key = entry.get("texture", f"block_{block_variant_index}")
-            variants[variant_key] = {
-                "name": f"block_{block_variant_index}",
-                "geometry": geometry,
-                "material_instances": {
-                    "*": {
-                        "texture": texture_key,
-                        "render_method": "alpha_test"
+    # Note blocks cannot map note=0 in Geyser, so those variants are remapped to note=24
+    mappings: dict[str, dict[str, Any]] = {
+        f"minecraft:{block_type}": {
+            "name": block_type,
+            **_BLOCK_SKELETON,
+            "state_overrides": {
+                entry["variant"].replace("note=0", "note=24"): {
+                    "name": f"block_{index}",
+                    "geometry": entry.get("geometry", "cube_all"),
+                    "material_instances": {
+                        "*": {"texture": entry.get("texture", f"block_{index}"), **_MAT_TEMPLATE}
                     }
                 }
-            }
-            
-        block_json = {
-            "name": block_type,
-            "included_in_creative_inventory": False,
-            "only_override_states": True,
-            "place_air": True,
-            "state_overrides": variants
+                for index, entry in enumerate(variant_list)
+                if entry.get("variant")
+            },
         }
-
-        mappings["minecraft:" +block_type] = block_json
+        for block_type, variant_list in entries.items()
+    }
 
     geyser_json = {
         "format_version": 1,
@@ -59,4 +59,4 @@ def write_geyser_block_mappings(entries: dict[str, list[dict[str, str]]], output
     }
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(geyser_json), encoding="utf-8")
+    fastjson.dump(geyser_json, output_path, pretty=pretty)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from collections import defaultdict
-import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+import os
 import urllib.request
 import shutil
 import uuid
-import zipfile
 from pathlib import Path
 from typing import Any, Optional
 import subprocess
@@ -25,11 +26,34 @@ from models import write_geyser_item_mappings
 from blocks import write_geyser_block_mappings
 from fonts import is_bedrock_glyph, generate_bedrock_glyph_font_file
 from services import build_pack_manifests, ensure_placeholder_texture
-from services.texture_atlas import generate_atlas
+from services.texture_atlas import generate_atlas, generate_shared_atlas
 from services.texture_utils import split_namespace
-from utils import hash_model_identifier, slugify, status_message, zip_directory
+from utils import ensure_directory, extract_archive, fastjson, hash_model_identifier, iter_json_files, slugify, status_message, zip_directory
 from sounds import get_sounds_from_pack, create_sound_mapping
 
+# Full 16x16x16 cube used when a block model has no geometry of its own.
+# build_geometry only reads elements, so every variant shares these objects.
+_CUBE_FACES = {
+    face: {"texture": "#all"}
+    for face in ("north", "south", "east", "west", "up", "down")
+}
+_CUBE_DISPLAY_SCALE = {"scale": [0.5, 0.5, 0.5]}
+_FALLBACK_CUBE_ELEMENTS = (
+    {
+        "name": "cube",
+        "from": [0, 0, 0],
+        "to": [16, 16, 16],
+        "faces": _CUBE_FACES,
+        "item_display_transforms": {
+            "thirdperson_righthand": _CUBE_DISPLAY_SCALE,
+            "thirdperson_lefthand": _CUBE_DISPLAY_SCALE,
+            "firstperson_righthand": _CUBE_DISPLAY_SCALE,
+            "firstperson_lefthand": _CUBE_DISPLAY_SCALE,
+        },
+    },
+)
+
+
 def convert_resource_pack(
     input_zip: str | Path,
     output_root: Optional[Path] = None,
@@ -37,6 +61,8 @@ def convert_resource_pack(
     *,
     attachable_material: str = "entity_alphablend",
     block_material: str = "alpha_test",
+    pretty: bool = False,
+    fast_zip: bool = True,
 ) -> Path:
     """
     Convert a Java resource pack zip into Bedrock-ready resource/behavior packs plus Geyser mappings.
@@ -55,6 +81,10 @@ def convert_resource_pack(
         output_root: Optional output directory. Defaults to ./target/.
         attachable_material: Bedrock material for attachables.
         block_material: Bedrock material for blocks.
+        pretty: Indent the Geyser mapping files for debugging.
+        fast_zip: Store already-compressed media (PNG, OGG, MP3, JPEG, WebP, ZIP)
+                  uncompressed and deflate other files at level 1 when packaging
+                  the .mcpack, instead of fully deflating everything.
 
     Returns:
         Tuple of (resource_pack_path, behavior_pack_path) pointing to the generated .mcpack files.
@@ -71,6 +101,8 @@ def convert_resource_pack(
     # Setup output structure
     output_root = Path(output_root or (Path.cwd() / "target"))
     shutil.rmtree(output_root, ignore_errors=True)
+    # Directories ensured by an earlier conversion in this process are gone now
+    ensure_directory.cache_clear()
     rp_root = output_root / "pack"
     rp_root.mkdir(parents=True, exist_ok=True)
 
@@ -108,8 +140,7 @@ def convert_resource_pack(
         shutil.rmtree(temp_extract, ignore_errors=True)
         temp_extract.mkdir(parents=True, exist_ok=True)
         
-        with zipfile.ZipFile(cached_pack, 'r') as zip_file:
-            zip_file.extractall(temp_extract)
+        extract_archive(cached_pack, temp_extract)
         
         # Find the extracted subdirectory and copy only textures to pack/
         subdirs = [d for d in temp_extract.iterdir() if d.is_dir()]
@@ -129,8 +160,7 @@ def convert_resource_pack(
     # Extract and process custom pack (overlays default assets)
     status_message("process", f"Extracting {input_zip.name}")
     # Extract into ./pack so humans can inspect the extracted files
-    with zipfile.ZipFile(input_zip, "r") as archive:
-        archive.extractall(extract_root)
+    extract_archive(input_zip, extract_root)
 
     pack_root = locate_pack_root(extract_root)
     if pack_root is None:
@@ -167,6 +197,7 @@ def convert_resource_pack(
     converted_block_entries, terrain_texture_data  = process_block_overrides(
         block_dir, pack_root, rp_root, blocks_root, custom_blocks_location, terrain_texture_data
     )
+    check_geometry_ids(converted_item_entries, converted_block_entries)
 
     if not converted_item_entries:
         raise RuntimeError("No convertible custom_model_data overrides were found")
@@ -193,18 +224,51 @@ def convert_resource_pack(
 
     # Write Geyser mappings
     mappings_path = output_root / "item_geyser_mappings.json"
-    write_geyser_item_mappings(converted_item_entries, mappings_path)
+    write_geyser_item_mappings(converted_item_entries, mappings_path, pretty=pretty)
     mappings_path = output_root / "block_geyser_mappings.json"
-    write_geyser_block_mappings(converted_block_entries, mappings_path)
+    write_geyser_block_mappings(converted_block_entries, mappings_path, pretty=pretty)
 
     # Package outputs
     resource_zip = output_root / f"{slugify(pack_description)}.mcpack"
-    zip_directory(rp_root, resource_zip)
+    zip_directory(rp_root, resource_zip, fast=fast_zip)
 
     status_message("completion", f"Conversion complete -> {resource_zip.name}")
     return resource_zip
 
 
+def check_geometry_ids(
+    item_entries: list[dict[str, Any]],
+    block_entries: dict[str, list[dict[str, str]]],
+) -> None:
+    """
+    Ensure no block geometry reuses the identifier of an item geometry.
+
+    Items and blocks sample different atlases, so a shared identifier would let
+    whichever geometry file Bedrock loads last break the other's UVs.
+
+    Args:
+        item_entries: Converted item entries; 3D ones carry a `geometry` id.
+        block_entries: Converted block entries per blockstate, each carrying a
+                       full `geometry` identifier.
+
+    Returns:
+        None.
+
+    Raises:
+        RuntimeError: If an item and a block geometry share an identifier.
+    """
+    item_ids = {
+        f"geometry.geyser_custom.{entry['geometry']}"
+        for entry in item_entries
+        if not entry.get("generated")
+    }
+    clashes = item_ids.intersection(
+        entry["geometry"] for entries in block_entries.values() for entry in entries
+    )
+    if clashes:
+        raise RuntimeError(f"Item and block geometries share identifiers: {', '.join(sorted(clashes))}")
+
+
 def build_pack_metadata(pack_description: str) -> dict[str, Any]:
     """
     Build pack metadata with UUIDs and version information.
@@ -257,7 +321,7 @@ def process_font_overrides(
     converted_entries: dict[str, dict[str, str]] = defaultdict(dict)
     status_message("process", "Walking font override files")
     counter = 0
-    font_file_data = json.loads(font_file_path.read_text(encoding="utf-8"))
+    font_file_data = fastjson.load(font_file_path)
     for character in font_file_data.get("providers", []):
         try:
             glyphs = character.get("chars", [])
@@ -302,6 +366,49 @@ def process_font_overrides(
             status_message("error", f"[Redstone Torch] Failed to generate font file {font_file}: {exc}")
             continue
 
+@lru_cache(maxsize=4096)
+def _resolve_parental_cached(model_path: str, mtime_ns: int, assets_root: str) -> dict[str, Any]:
+    return resolve_parental(Path(model_path), assets_root=Path(assets_root))
+
+
+def resolve_model(model_json: Path, pack_root: Path) -> dict[str, Any]:
+    """
+    Resolve a Java model's parent chain, reusing earlier results for the same file.
+
+    Many overrides and blockstate variants point at the same model, so results are
+    memoized on the model path and its modification time. The returned dictionary
+    is shared between callers and must not be mutated.
+
+    Args:
+        model_json: Path to the Java model JSON inside the extracted pack.
+        pack_root: Root directory of the extracted Java pack.
+
+    Returns:
+        Output of `resolve_parental` for the model.
+    """
+    return _resolve_parental_cached(str(model_json), model_json.stat().st_mtime_ns, str(pack_root))
+
+def build_model_index(pack_root: Path) -> dict[str, Path]:
+    """
+    Index every JSON file of the extracted pack by each of its trailing path suffixes.
+
+    A single walk replaces one `rglob` per block variant: looking up
+    `assets/<namespace>/models/<model>.json` or `<model>.json` in the index returns
+    the same file the equivalent `rglob` pattern would have matched first.
+
+    Args:
+        pack_root: Root directory of the extracted Java pack.
+
+    Returns:
+        Mapping of POSIX path suffixes to the first matching JSON file.
+    """
+    model_index: dict[str, Path] = {}
+    for file_path in iter_json_files(pack_root):
+        parts = file_path.relative_to(pack_root).parts
+        for start in range(len(parts)):
+            model_index.setdefault("/".join(parts[start:]), file_path)
+    return model_index
+
 def process_block_overrides(
     block_dir: Path,
     pack_root: Path,
@@ -324,49 +431,35 @@ def process_block_overrides(
     Returns:
         Tuple of (converted_entries, item_texture_data, terrain_texture_data, lang_entries).
     """
-    converted_entries: dict[str, list[dict[str, str]]] = defaultdict(list)
     status_message("process", "Walking block override files")
-    counter = 0
 
     # Create a shared cube geometry + atlas for fallbacks (Option A)
+    cube_entry: Optional[dict[str, str]] = None
     try:
         placeholder_tex = rp_root / "textures" / "custom_blocks" / "placeholder.png"
-        # ensure blocks_root exists for atlas output
-        blocks_root.mkdir(parents=True, exist_ok=True)
         cube_atlas_key, cube_frames, cube_atlas_path, cube_atlas_size = generate_atlas(
             {"all": placeholder_tex}, blocks_root, "cube"
         )
         cube_geometry_id = "cube"
         cube_geometry_identifier = f"geometry.geyser_custom.{cube_geometry_id}"
-        cube_elements = [
-            {
-                "name": "cube",
-                "from": [0, 0, 0],
-                "to": [16, 16, 16],
-                "faces": {
-                    face: {"texture": "#all"}
-                    for face in ("north", "south", "east", "west", "up", "down")
-                },
-                "item_display_transforms": {
-                    "thirdperson_righthand": {"scale": [0.5, 0.5, 0.5]},
-                    "thirdperson_lefthand": {"scale": [0.5, 0.5, 0.5]},
-                    "firstperson_righthand": {"scale": [0.5, 0.5, 0.5]},
-                    "firstperson_lefthand": {"scale": [0.5, 0.5, 0.5]}
-                }
-            }
-        ]
         rp_cube_models_dir = rp_root / "models" / "blocks" / "geyser_custom"
         rp_cube_models_dir.mkdir(parents=True, exist_ok=True)
-        cube_geometry = build_geometry(cube_elements, cube_frames, cube_atlas_size, cube_geometry_identifier)
-        (rp_cube_models_dir / "cube.json").write_text(json.dumps(cube_geometry), encoding="utf-8")
+        cube_geometry = build_geometry(list(_FALLBACK_CUBE_ELEMENTS), cube_frames, cube_atlas_size, cube_geometry_identifier)
+        fastjson.dump(cube_geometry, rp_cube_models_dir / "cube.json")
         # Register cube atlas in terrain texture manifest data
         terrain_texture_data[cube_atlas_key] = {"textures": f"textures/{custom_blocks_location}/{cube_atlas_path.name}"}
+        cube_entry = {"geometry": cube_geometry_identifier, "texture": cube_atlas_key}
     except Exception as exc:
         status_message("info", f"Failed to create shared cube geometry/atlas: {exc}")
-    for block_file in sorted(block_dir.rglob("*.json")):
+
+    # Collect every convertible variant before resolving and packing them
+    model_index = build_model_index(pack_root)
+    jobs: list[tuple[str, str, str, Path]] = []
+    block_files = list(iter_json_files(block_dir))
+    for block_file in block_files:
         try:
-            block_data = json.loads(block_file.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
+            block_data = fastjson.load(block_file)
+        except fastjson.JSONDecodeError as exc:
             status_message("error", f"[Jungle Planks] Skipping invalid JSON {block_file}: {exc}")
             continue
 
@@ -377,92 +470,134 @@ def process_block_overrides(
 
             # Locate the referenced model JSON in the extracted pack
             namespace, relative_model = split_namespace(target_model, default_namespace="minecraft")
-            model_glob = f"assets/{namespace}/models/{relative_model}.json"
-            model_json = None
-            for p in pack_root.rglob(model_glob):
-                model_json = p
-                break
-            if model_json is None:
-                for p in pack_root.rglob(f"{relative_model}.json"):
-                    model_json = p
-                    break
+            model_json = (
+                model_index.get(f"assets/{namespace}/models/{relative_model}.json")
+                or model_index.get(f"{relative_model}.json")
+            )
             if model_json is None:
                 status_message("error", f"[Note Block] Block model JSON not found for {target_model}. Target: {model_ref}")
                 continue
 
-            try:
-                resolved = resolve_parental(model_json, assets_root=pack_root)
-            except Exception as exc:
-                status_message("error", f"[Copper Torch] Failed to resolve {model_json}: {exc}")
-                continue
+            jobs.append((block_file.stem, variant, target_model, model_json))
+
+    # Resolve every variant up front so all block textures can share one atlas.
+    # Generated (sprite) models and models without elements map straight onto the
+    # shared cube instead of getting their own geometry.
+    converted_by_index: dict[int, dict[str, str]] = {}
+    resolved_jobs: list[tuple[int, str, str, Path, dict[str, Any]]] = []
+    for index, (_, variant, target_model, model_json) in enumerate(jobs):
+        try:
+            resolved = resolve_model(model_json, pack_root)
+        except Exception as exc:
+            status_message("error", f"[Copper Torch] Failed to resolve {model_json}: {exc}")
+            continue
+        if cube_entry is not None and (resolved.get("generated") or not resolved.get("elements")):
+            converted_by_index[index] = {"variant": variant, **cube_entry}
+            continue
+        resolved_jobs.append((index, variant, target_model, model_json, resolved))
 
-            # If the model is generated (sprite) or has no elements, fallback to a cube
+    if resolved_jobs:
+        try:
+            atlases = generate_shared_atlas(
+                {index: resolved["texture_paths"] for index, *_, resolved in resolved_jobs},
+                blocks_root,
+                "blocks",
+            )
+        except Exception as exc:
+            status_message("error", f"[Iron Door] Shared block atlas generation failed: {exc}")
+            atlases = {}
+
+        # Many variants share a model directory, so create each one once up front
+        # instead of issuing a makedirs for every variant
+        created_dirs: set[Path] = set()
+        for index, variant, target_model, model_json, resolved in resolved_jobs:
+            atlas = atlases.get(index)
+            if atlas is None:
+                status_message("error", f"[Iron Door] Atlas generation failed for {target_model}: missing or unreadable textures")
+                continue
+            atlas_key, _, atlas_path, _ = atlas
+            # Large packs spill into several atlases; register each one that is used
+            # in the terrain texture manifest (paths relative to rp textures dir)
+            terrain_texture_data[atlas_key] = {"textures": f"textures/{custom_blocks_location}/{atlas_path.name}"}
+            # Only reached without a shared cube, so build a cube of our own
             elements = resolved.get("elements")
             if resolved.get("generated") or not elements:
-                elements = [
-                    {
-                        "name": "cube",
-                        "from": [0, 0, 0],
-                        "to": [16, 16, 16],
-                        "faces": {
-                            face: {"texture": "#all"}
-                            for face in ("north", "south", "east", "west", "up", "down")
-                        },
-                        "item_display_transforms": {
-                            "thirdperson_righthand": {"scale": [0.5, 0.5, 0.5]},
-                            "thirdperson_lefthand": {"scale": [0.5, 0.5, 0.5]},
-                            "firstperson_righthand": {"scale": [0.5, 0.5, 0.5]},
-                            "firstperson_lefthand": {"scale": [0.5, 0.5, 0.5]}
-                        }
-                    }
-                ]
-
-            # Build unique ids/hashes for atlas and geometry
-            predicate_key = f"{block_file.stem}_{variant}_{counter}"
-            entry_hash, geo_hash = hash_model_identifier(predicate_key, str(model_json))
-            path_hash = f"gmdl_{entry_hash}"
-            geometry_id = f"geo_{geo_hash}"
-            geometry_identifier = f"geometry.geyser_custom.{geometry_id}"
-
-            # Generate an atlas for this block's textures
-            try:
-                atlas_key, frames, atlas_path, atlas_size = generate_atlas(resolved["texture_paths"], blocks_root, path_hash)
-            except Exception as exc:
-                status_message("error", f"[Iron Door] Atlas generation failed for {target_model}: {exc}")
-                continue
+                elements = list(_FALLBACK_CUBE_ELEMENTS)
 
-            # Build Bedrock geometry and write it into the resource pack
-            try:
-                geometry = build_geometry(elements, frames, atlas_size, geometry_identifier)
-            except Exception as exc:
-                status_message("error", f"[White Wool] Geometry build failed for {target_model}: {exc}")
-                continue
+            namespace, relative_model = split_namespace(target_model, default_namespace="minecraft")
+            rp_models_dir = rp_root / "models" / "blocks" / namespace / relative_model.rpartition("/")[0]
+            if rp_models_dir not in created_dirs:
+                rp_models_dir.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(rp_models_dir)
+
+            entry = process_single_block_variant(variant, target_model, model_json, elements, atlas, rp_models_dir)
+            if entry is not None:
+                converted_by_index[index] = entry
+
+    # Merge in blockstate order to keep the output deterministic. Every stem is
+    # known up front, so the merge loop appends to plain lists
+    converted_entries: dict[str, list[dict[str, str]]] = {block_file.stem: [] for block_file in block_files}
+    for index in sorted(converted_by_index):
+        converted_entries[jobs[index][0]].append(converted_by_index[index])
+
+    # Blockstates without a single converted variant get no mapping
+    return {stem: entries for stem, entries in converted_entries.items() if entries}, terrain_texture_data
+
+def process_single_block_variant(
+    variant: str,
+    target_model: str,
+    model_json: Path,
+    elements: list[dict[str, Any]],
+    atlas: tuple[str, dict[str, dict[str, float]], Path, tuple[int, int]],
+    rp_models_dir: Path,
+) -> Optional[dict[str, str]]:
+    """
+    Convert a single blockstate variant into Bedrock geometry.
 
-            model_parts = relative_model.split("/")
-            model_name = model_parts[-1]
-            model_path = "/".join(model_parts[:-1])
-            rp_models_dir = rp_root / "models" / "blocks" / namespace / model_path
-            rp_models_dir.mkdir(parents=True, exist_ok=True)
-            geometry_file = rp_models_dir / f"{model_name}.{geometry_id}.json"
-            try:
-                geometry_file.write_text(json.dumps(geometry), encoding="utf-8")
-            except Exception as exc:
-                status_message("error", f"[Red Wool] Failed to write geometry {geometry_file}: {exc}")
-                continue
+    Writes the variant's geometry and returns the entry the caller has to merge
+    into the Geyser mappings.
 
-            # Register texture in terrain texture manifest (paths relative to rp textures dir)
-            terrain_texture_data[atlas_key] = {"textures": f"textures/{custom_blocks_location}/{atlas_path.name}"}
+    Args:
+        variant: Blockstate variant key.
+        target_model: Model reference from the blockstate file.
+        model_json: Path to the referenced model JSON in the extracted pack.
+        elements: Resolved model elements (or the fallback cube).
+        atlas: The (atlas_key, frames, atlas_path, atlas_size) tuple
+               `generate_shared_atlas` returned for this variant.
+        rp_models_dir: Existing resource pack directory the geometry is written to.
 
-            # Append converted variant entry
-            converted_entries[block_file.stem].append({
-                "variant": variant,
-                "geometry": geometry_identifier,
-                "texture": atlas_key,
-            })
+    Returns:
+        Converted mapping entry if successful, None otherwise.
+    """
+    atlas_key, frames, _, atlas_size = atlas
+    # The geometry's UVs point into one block atlas page, so the id covers the
+    # page as well as the model. The block_ prefix keeps it apart from the item
+    # geometry of the same model, which samples the item's own atlas
+    _, geo_hash = hash_model_identifier(variant, f"{model_json}#{atlas_key}")
+    geometry_id = f"block_geo_{geo_hash}"
+    geometry_identifier = f"geometry.geyser_custom.{geometry_id}"
+
+    # Build Bedrock geometry and write it into the resource pack
+    try:
+        geometry = build_geometry(elements, frames, atlas_size, geometry_identifier)
+    except Exception as exc:
+        status_message("error", f"[White Wool] Geometry build failed for {target_model}: {exc}")
+        return None
 
-            counter += 1
+    _, relative_model = split_namespace(target_model, default_namespace="minecraft")
+    model_name = relative_model.rpartition("/")[2]
+    geometry_file = rp_models_dir / f"{model_name}.{geometry_id}.json"
+    try:
+        fastjson.dump(geometry, geometry_file)
+    except Exception as exc:
+        status_message("error", f"[Red Wool] Failed to write geometry {geometry_file}: {exc}")
+        return None
 
-    return converted_entries, terrain_texture_data
+    return {
+        "variant": variant,
+        "geometry": geometry_identifier,
+        "texture": atlas_key,
+    }
 
 def process_model_overrides(
     item_dir: Path,
@@ -497,12 +632,14 @@ def process_model_overrides(
     mkdir_textures = textures_root / "2d_renders"
     mkdir_textures.mkdir(parents=True, exist_ok=True)
     
-    for model_file in sorted(item_dir.rglob("*.json")):
+    # Collect every override first; each one converts independently of the others
+    jobs: list[tuple[str, Any, int, str]] = []
+    for model_file in iter_json_files(item_dir):
         item_id = f"minecraft:{model_file.stem}"
         
         try:
-            model_data = json.loads(model_file.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
+            model_data = fastjson.load(model_file)
+        except fastjson.JSONDecodeError as exc:
             status_message("error", f"[Acacia Planks] Skipping invalid JSON {model_file}: {exc}")
             continue
 
@@ -516,12 +653,26 @@ def process_model_overrides(
             if not target_model:
                 continue
 
-            # Process single override
-            entry = process_single_item_override(
-                item_id, cmd, index, target_model, pack_root, 
-                rp_root, textures_root, materials
-            )
-            
+            jobs.append((item_id, cmd, index, target_model))
+
+    if not jobs:
+        return converted_entries, item_texture_data, terrain_texture_data, lang_entries
+
+    convert_override = partial(
+        process_single_item_override,
+        pack_root=pack_root,
+        rp_root=rp_root,
+        textures_root=textures_root,
+        materials=materials,
+    )
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(
+            convert_override,
+            *zip(*jobs),
+            chunksize=max(1, len(jobs) // ((os.cpu_count() or 1) * 4)),
+        )
+        # Merge on the main process, in submission order, to keep the output deterministic
+        for (item_id, cmd, _, _), entry in zip(jobs, results):
             if entry is None:
                 continue
 
@@ -559,6 +710,9 @@ def process_single_item_override(
     """
     Process a single model override entry.
 
+    Runs inside a worker process; the caller merges the returned entry into the
+    mappings, language and texture manifests.
+
     Args:
         item_id: Full item identifier.
         cmd: Custom model data value.
@@ -581,7 +735,7 @@ def process_single_item_override(
         return None
 
     try:
-        resolved = resolve_parental(target_json, assets_root=pack_root)
+        resolved = resolve_model(target_json, pack_root)
     except Exception as exc:
         status_message("error", f"[Redstone Torch] Failed to resolve {target_json}: {exc}")
         return None
@@ -639,6 +793,8 @@ if __name__ == "__main__":
     parser.add_argument("-o", "--output", help="Output directory", default="target")
     parser.add_argument("--attachable-material", default="entity_alphablend", help="Material for attachables")
     parser.add_argument("--block-material", default="alpha_test", help="Material for blocks")
+    parser.add_argument("--pretty", action="store_true", help="Indent the Geyser mapping files")
+    parser.add_argument("--no-fast-zip", dest="fast_zip", action="store_false", help="Fully deflate the .mcpack")
 
     args = parser.parse_args()
 
@@ -648,6 +804,8 @@ if __name__ == "__main__":
             Path(args.output),
             attachable_material=args.attachable_material,
             block_material=args.block_material,
+            pretty=args.pretty,
+            fast_zip=args.fast_zip,
         )
     except Exception as e:
         status_message("error", "[Iron Block]" + str(e))
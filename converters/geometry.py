@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping
+
+# Shared default for missing from/to/origin vectors
+_ZERO3 = (0.0, 0.0, 0.0)
 
 
 def round_value(value: float) -> float:
@@ -18,6 +21,37 @@ def round_value(value: float) -> float:
     return round(value + 0.0, 4)
 
 
+def _face_frame(
+    face: Mapping[str, Any],
+    frames_get: Callable[[str], Mapping[str, float] | None],
+) -> Mapping[str, float] | None:
+    """Return the atlas frame a Java face samples from, or None if it has no usable texture."""
+    texture_ref = face.get("texture")
+    if not texture_ref:
+        return None
+    return frames_get(texture_ref.removeprefix("#"))
+
+
+def _build_face(face: Mapping[str, Any], frame: Mapping[str, float]) -> dict[str, list[float]]:
+    """Map a Java face uv (0-16 space) into the rounded Bedrock uv/uv_size payload."""
+    x, y, w, h = frame["x"], frame["y"], frame["w"], frame["h"]
+    uv = face.get("uv")
+    if uv:
+        scale_x = w / 16
+        scale_y = h / 16
+        u0 = x + uv[0] * scale_x
+        v0 = y + uv[1] * scale_y
+        u1 = x + uv[2] * scale_x
+        v1 = y + uv[3] * scale_y
+    else:
+        u0, v0 = x, y
+        u1, v1 = x + w, y + h
+    return {
+        "uv": [round_value(u0), round_value(v0)],
+        "uv_size": [round_value(u1 - u0), round_value(v1 - v0)],
+    }
+
+
 def build_geometry(
     elements: list[Mapping[str, Any]] | None,
     frames: Mapping[str, Mapping[str, float]],
@@ -33,7 +67,8 @@ def build_geometry(
     Args:
         elements: List of Java model cube definitions.
         frames: Mapping of texture keys to frame data (x, y, w, h) in the atlas.
-        atlas_size: Tuple of (width, height) of the texture atlas.
+        atlas_size: Tuple of (width, height) of the texture atlas, both at least 1
+                    (as returned by the atlas generators).
         geometry_identifier: Bedrock geometry identifier string.
 
     Returns:
@@ -47,16 +82,16 @@ def build_geometry(
 
     cubes: list[dict[str, Any]] = []
     atlas_width, atlas_height = atlas_size
+    frames_get = frames.get
 
     for element in elements:
-        from_vec = element.get("from", [0, 0, 0])
-        to_vec = element.get("to", [0, 0, 0])
-        
+        from_vec = element.get("from", _ZERO3)
+        to_vec = element.get("to", _ZERO3)
         cube: dict[str, Any] = {
             "origin": [
-                round_value(-to_vec[0] + 8), 
-                round_value(from_vec[1]), 
-                round_value(from_vec[2] - 8)
+                round_value(-to_vec[0] + 8),
+                round_value(from_vec[1]),
+                round_value(from_vec[2] - 8),
             ],
             "size": [
                 round_value(to_vec[0] - from_vec[0]),
@@ -67,10 +102,11 @@ def build_geometry(
 
         # Handle rotation if present
         if rotation := element.get("rotation"):
+            rotation_origin = rotation.get("origin", _ZERO3)
             cube["pivot"] = [
-                round_value(-rotation.get("origin", [0, 0, 0])[0] + 8),
-                round_value(rotation.get("origin", [0, 0, 0])[1]),
-                round_value(rotation.get("origin", [0, 0, 0])[2] - 8),
+                round_value(-rotation_origin[0] + 8),
+                round_value(rotation_origin[1]),
+                round_value(rotation_origin[2] - 8),
             ]
             angle = rotation.get("angle", 0)
             axis = rotation.get("axis")
@@ -83,45 +119,23 @@ def build_geometry(
                 cube["rotation"] = [0, 0, round_value(angle)]
 
         # Process faces
-        faces_payload: dict[str, Any] = {}
-        for face_name, face in (element.get("faces") or {}).items():
-            texture_ref = face.get("texture")
-            if not texture_ref:
-                continue
-            
-            texture_key = texture_ref[1:] if texture_ref.startswith("#") else texture_ref
-            frame = frames.get(texture_key)
-            if not frame:
-                continue
-            
-            uv = face.get("uv")
-            if uv:
-                scale_x = frame["w"] / 16
-                scale_y = frame["h"] / 16
-                u0 = frame["x"] + uv[0] * scale_x
-                v0 = frame["y"] + uv[1] * scale_y
-                u1 = frame["x"] + uv[2] * scale_x
-                v1 = frame["y"] + uv[3] * scale_y
-            else:
-                u0, v0 = frame["x"], frame["y"]
-                u1, v1 = frame["x"] + frame["w"], frame["y"] + frame["h"]
-
-            faces_payload[face_name] = {
-                "uv": [round_value(u0), round_value(v0)],
-                "uv_size": [round_value(u1 - u0), round_value(v1 - v0)],
-            }
-
+        faces_payload: dict[str, Any] = {
+            face_name: _build_face(face, frame)
+            for face_name, face in (element.get("faces") or {}).items()
+            if (frame := _face_frame(face, frames_get))
+        }
         if faces_payload:
             cube["uv"] = faces_payload
         cubes.append(cube)
+
     geometry = {
         "format_version": "1.16.0",
         "minecraft:geometry": [
             {
                 "description": {
                     "identifier": geometry_identifier,
-                    "texture_width": max(1, atlas_width),
-                    "texture_height": max(1, atlas_height),
+                    "texture_width": atlas_width,
+                    "texture_height": atlas_height,
                     "visible_bounds_width": 4,
                     "visible_bounds_height": 4.5,
                     "visible_bounds_offset": [0, 0.75, 0],
@@ -6,10 +6,11 @@ Changes here will NOT affect 3D model conversion.
 
 from __future__ import annotations
 
-import shutil
 from pathlib import Path
 from typing import Any, Mapping
 
+from utils import copy_file_contents, ensure_directory
+
 
 def convert_2d_item(
     entry: Mapping[str, Any],
@@ -46,8 +47,8 @@ def convert_2d_item(
     if not texture_paths:
         raise ValueError(f"2D item {path_hash} has no textures to copy")
     texture_target = textures_root / "2d_items" / f"{path_hash}.png"
-    texture_target.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(texture_paths[0], texture_target)
+    ensure_directory(texture_target.parent)
+    copy_file_contents(texture_paths[0], texture_target)
     files_written["texture"] = texture_target
 
     return files_written
\ No newline at end of file
@@ -6,9 +6,10 @@ Changes here will NOT affect 2D sprite conversion.
 
 from __future__ import annotations
 
-import json
-import shutil
+import hashlib
 import math
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping
 import subprocess
@@ -22,8 +23,63 @@ except ImportError:
     np = None
 
 from services.texture_atlas import generate_atlas
+from utils import copy_file_contents, ensure_directory, fastjson, write_file
 from .geometry import build_geometry
 
+# Constant parts of the attachable and animation JSON. They are shared by
+# reference between items, which is safe because they are only serialized.
+_ATTACHABLE_SCRIPTS = {
+    "pre_animation": [
+        "v.main_hand = c.item_slot == 'main_hand';",
+        "v.off_hand = c.item_slot == 'off_hand';",
+        "v.head = c.item_slot == 'head';",
+    ],
+    "animate": [
+        {"thirdperson_main_hand": "v.main_hand && !c.is_first_person"},
+        {"thirdperson_off_hand": "v.off_hand && !c.is_first_person"},
+        {"thirdperson_head": "v.head && !c.is_first_person"},
+        {"firstperson_main_hand": "v.main_hand && c.is_first_person"},
+        {"firstperson_off_hand": "v.off_hand && c.is_first_person"},
+        {"firstperson_head": "c.is_first_person && v.head"},
+    ],
+}
+_ATTACHABLE_RENDER_CONTROLLERS = ["controller.render.item_default"]
+_THIRDPERSON_ROOT_BONE = {"rotation": [90, 0, 0], "position": [0, 13, -3]}
+_HEAD_ROOT_BONE = {"position": [0, 19.9, 0]}
+_FIRSTPERSON_ROOT_BONE = {"rotation": [90, 60, -40], "position": [4, 10, 4], "scale": 1.5}
+# Defaults for missing Java display values; tuples so no call can mutate them
+_ZERO3 = (0, 0, 0)
+_UNIT_SCALE = (1, 1, 1)
+_HEAD_DEFAULT_SCALE = (0.625, 0.625, 0.625)
+_FIRSTPERSON_DEFAULT_ROTATION = (0.1, 0.1, 0.1)
+# The renderer has no batch mode, so a JVM starts per icon. Each run is short,
+# which the C1-only JIT, serial GC and class data sharing make cheaper to start.
+_RENDERER_COMMAND = (
+    "java",
+    "-XX:TieredStopAtLevel=1",
+    "-XX:+UseSerialGC",
+    "-Xshare:auto",
+    "-jar",
+    "libs/BedrockAdderRenderer-1.3.6.jar",
+)
+# One row per Bedrock animation, following converter.sh:
+# (animation suffix, Java display slot, root bone, negate x position, negate z position,
+#  position/scale factor, x bone rotation used when Java has no rotation)
+# The child bones always get rot=[-x, -y, z].
+_ANIMATION_SLOTS = (
+    ("thirdperson_main_hand", "thirdperson_righthand", _THIRDPERSON_ROOT_BONE, True, False, None, None),
+    ("thirdperson_off_hand", "thirdperson_lefthand", _THIRDPERSON_ROOT_BONE, False, False, None, None),
+    ("head", "head", _HEAD_ROOT_BONE, True, False, 0.625, None),
+    ("firstperson_main_hand", "firstperson_righthand", _FIRSTPERSON_ROOT_BONE, True, True, None, _FIRSTPERSON_DEFAULT_ROTATION),
+    ("firstperson_off_hand", "firstperson_lefthand", _FIRSTPERSON_ROOT_BONE, False, True, None, _FIRSTPERSON_DEFAULT_ROTATION),
+)
+# Atlases generated by this process, by `_atlas_name`
+_GENERATED_ATLASES: dict[str, tuple[str, dict[str, dict[str, float]], Path, tuple[int, int]]] = {}
+# Animation files written by this process and their contents
+_WRITTEN_ANIMATIONS: dict[Path, bytes] = {}
+# Icons rendered by this process, keyed by `_render_digest` of their inputs
+_RENDERED_ICONS: dict[str, Path] = {}
+
 
 def convert_3d_item(
     entry: Mapping[str, Any],
@@ -66,18 +122,23 @@ def convert_3d_item(
 
     # Setup directories
     rp_models_dir = rp_root / "models" / "blocks" / namespace / model_path
-    rp_models_dir.mkdir(parents=True, exist_ok=True)
+    ensure_directory(rp_models_dir)
 
     rp_attachables_dir = rp_root / "attachables" / namespace / model_path
-    rp_attachables_dir.mkdir(parents=True, exist_ok=True)
+    ensure_directory(rp_attachables_dir)
 
     # Generate texture atlas from model textures
     textures = resolved_model["texture_paths"]
-    placeholder = list(textures.keys())[0]
+    # The first texture doubles as the icon when no render can be produced
+    placeholder = next(iter(textures.values()), None)
     atlas_dir = textures_root / "models"
-    atlas_key, frames, atlas_path, atlas_size = generate_atlas(
-        textures, atlas_dir, path_hash
-    )
+    # Items with the same textures share one atlas, named after the texture set
+    atlas_name = _atlas_name(textures)
+    atlas = _GENERATED_ATLASES.get(atlas_name)
+    if atlas is None or not atlas[2].exists():
+        atlas = generate_atlas(textures, atlas_dir, atlas_name)
+        _GENERATED_ATLASES[atlas_name] = atlas
+    atlas_key, frames, atlas_path, atlas_size = atlas
     files_written["atlas"] = atlas_path
 
     # Handle Icon (2D sprite for inventory)
@@ -85,11 +146,19 @@ def convert_3d_item(
     icon_generated = False
 
     if Image:
+        render_id = namespace + ":" + model_name
         try:
-            print(namespace + ":" + model_name,)
-            generate_cool_3d_render(namespace + ":" + model_name, str(icon_target))
-            #generate_3d_render(resolved_model, textures, icon_target)
+            render_key = _render_digest(render_id, textures)
+            rendered = _RENDERED_ICONS.get(render_key)
+            if rendered is None or not rendered.exists():
+                print(render_id)
+                generate_cool_3d_render(render_id, str(icon_target))
+                #generate_3d_render(resolved_model, textures, icon_target)
+            elif rendered != icon_target:
+                # Same model and textures as an earlier item, so skip launching the renderer
+                copy_file_contents(rendered, icon_target)
             if icon_target.exists():
+                _RENDERED_ICONS[render_key] = icon_target
                 icon_texture_name = path_hash
                 icon_generated = True
         except Exception as e:
@@ -98,7 +167,7 @@ def convert_3d_item(
     if not icon_generated:
         if placeholder:
             # Copy icon texture to the root textures folder
-            shutil.copy2(placeholder, icon_target)
+            copy_file_contents(placeholder, icon_target)
             icon_texture_name = path_hash
         else:
             icon_texture_name = "camera"    
@@ -112,10 +181,10 @@ def convert_3d_item(
         geometry_identifier
     )
     geometry_file = rp_models_dir / f"{model_name}.json"
-    geometry_file.write_text(json.dumps(geometry), encoding="utf-8")
+    fastjson.dump(geometry, geometry_file)
     files_written["geometry"] = geometry_file
 
-    attachable = create_3d_attachable_definition(
+    attachable = encode_3d_attachable_definition(
         identifier,
         attachable_material,
         f"models/{atlas_path.name}", 
@@ -123,18 +192,93 @@ def convert_3d_item(
     )
     short_name = model_name[:20] if len(model_name) > 20 else model_name
     attachable_file = rp_attachables_dir / f"{short_name}.{path_hash}.attachable.json"
-    attachable_file.write_text(json.dumps(attachable), encoding="utf-8")
+    write_file(attachable_file, attachable)
     files_written["attachable"] = attachable_file
     animations_dir = rp_root / "animations" / namespace / model_path
-    animations_dir.mkdir(parents=True, exist_ok=True)
-    animations = generate_item_animations(geometry_id, resolved_model.get("display") or {})
+    ensure_directory(animations_dir)
+    display_json = fastjson.dumps(resolved_model.get("display") or {})
     animation_file = animations_dir / f"animation.{model_name}.json"
-    animation_file.write_text(json.dumps(animations), encoding="utf-8")
+    animation_json = _item_animations_json(geometry_id, display_json)
+    # Overrides of the same model share this file, so identical bytes are written once
+    if _WRITTEN_ANIMATIONS.get(animation_file) != animation_json or not animation_file.exists():
+        write_file(animation_file, animation_json)
+        _WRITTEN_ANIMATIONS[animation_file] = animation_json
     files_written["animation"] = animation_file
     return files_written
 
+@lru_cache(maxsize=4096)
+def _item_animations_json(geometry_id: str, display_json: bytes) -> bytes:
+    """
+    Serialize the animations of a geometry, reusing the result for repeated inputs.
+
+    Item identifiers are unique per override, but overrides that point at the
+    same model share both the geometry id and the Java display settings, so
+    their animation files are identical.
+
+    Args:
+        geometry_id: The geometry ID suffix.
+        display_json: The model's serialized 'display' section.
+
+    Returns:
+        Encoded animation JSON, ready to be written to disk.
+    """
+    if display_json == b"{}":
+        # Most models carry no display settings; only the geometry id varies then
+        return _DEFAULT_ANIMATIONS_TEMPLATE.replace(b"__GEO__", fastjson.dumps(geometry_id)[1:-1])
+    return fastjson.dumps(generate_item_animations(geometry_id, fastjson.loads(display_json)))
+
+
+def _atlas_name(textures: Mapping[str, Path]) -> str:
+    """
+    Name the atlas of a texture set after everything its layout depends on.
+
+    The packer is deterministic, so equal texture sets produce equal atlases and
+    can share one file, even when generated by different worker processes. The
+    name hashes file contents rather than paths or mtimes so it is stable
+    between runs.
+
+    Args:
+        textures: Texture keys and PNG paths of the resolved model, in order.
+
+    Returns:
+        Atlas name of the form `atlas_<16 hex digits>`.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    # Keys sharing a PNG share one atlas region, so the layout depends on which do
+    first_use: dict[Path, int] = {}
+    for index, (key, path) in enumerate(textures.items()):
+        path = Path(path).resolve()
+        slot = first_use.setdefault(path, index)
+        digest.update(f"{key}\0{slot}\0".encode("utf-8"))
+        digest.update(_file_digest(str(path), path.stat().st_mtime_ns))
+    return f"atlas_{digest.hexdigest()}"
+
+
+@lru_cache(maxsize=4096)
+def _file_digest(path: str, mtime_ns: int) -> bytes:
+    """Hash a file's contents, memoized per path and modification time."""
+    return hashlib.blake2b(Path(path).read_bytes(), digest_size=8).digest()
+
+
+def _render_digest(render_id: str, textures: Mapping[str, Path]) -> str:
+    """
+    Digest everything an icon render depends on.
+
+    Args:
+        render_id: Model identifier passed to the renderer.
+        textures: Texture keys and PNG paths of the resolved model.
+
+    Returns:
+        16-character hex digest of the id and each texture's path and mtime.
+    """
+    digest = hashlib.blake2b(render_id.encode("utf-8"), digest_size=8)
+    for key, path in sorted(textures.items()):
+        digest.update(f"\0{key}\0{path}\0{Path(path).stat().st_mtime_ns}".encode("utf-8"))
+    return digest.hexdigest()
+
+
 def generate_cool_3d_render(id, path):
-    subprocess.run(["java", "-jar", "libs/BedrockAdderRenderer-1.3.6.jar", "render", "512", id, path], check=False)
+    subprocess.run([*_RENDERER_COMMAND, "render", "512", id, path], check=False)
 
 
 
@@ -203,21 +347,7 @@ def create_3d_attachable_definition(
                 "geometry": {
                     "default": geometry_identifier
                 },
-                "scripts": {
-                    "pre_animation": [
-                        "v.main_hand = c.item_slot == 'main_hand';",
-                        "v.off_hand = c.item_slot == 'off_hand';",
-                        "v.head = c.item_slot == 'head';",
-                    ],
-                    "animate": [
-                        {"thirdperson_main_hand": "v.main_hand && !c.is_first_person"},
-                        {"thirdperson_off_hand": "v.off_hand && !c.is_first_person"},
-                        {"thirdperson_head": "v.head && !c.is_first_person"},
-                        {"firstperson_main_hand": "v.main_hand && c.is_first_person"},
-                        {"firstperson_off_hand": "v.off_hand && c.is_first_person"},
-                        {"firstperson_head": "c.is_first_person && v.head"},
-                    ],
-                },
+                "scripts": _ATTACHABLE_SCRIPTS,
                 "animations": {
                     "thirdperson_main_hand": f"animation.geyser_custom.{geo_suffix}.thirdperson_main_hand",
                     "thirdperson_off_hand": f"animation.geyser_custom.{geo_suffix}.thirdperson_off_hand",
@@ -226,12 +356,57 @@ def create_3d_attachable_definition(
                     "firstperson_off_hand": f"animation.geyser_custom.{geo_suffix}.firstperson_off_hand",
                     "firstperson_head": "animation.geyser_custom.disable",
                 },
-                "render_controllers": ["controller.render.item_default"],
+                "render_controllers": _ATTACHABLE_RENDER_CONTROLLERS,
             },
         },
     }
 
 
+_GEOMETRY_PREFIX = "geometry.geyser_custom."
+# The attachable JSON is rendered once with placeholders; per item only the
+# variable fields are substituted, in a single pass so values are never rescanned
+_ATTACHABLE_TEMPLATE = fastjson.dumps(
+    create_3d_attachable_definition("__IDENT__", "__MAT__", "__ATLAS__", f"{_GEOMETRY_PREFIX}__GEO__")
+)
+_ATTACHABLE_FIELD = re.compile(rb"__(?:IDENT|MAT|ATLAS|GEO)__")
+
+
+def encode_3d_attachable_definition(
+    identifier: str,
+    material: str,
+    atlas_filename: str,
+    geometry_identifier: str,
+) -> bytes:
+    """
+    Encode the attachable definition of a 3D model item straight to JSON bytes.
+
+    Equivalent to serializing `create_3d_attachable_definition`, but fills a
+    pre-encoded template instead of building and encoding the dicts per item.
+
+    Args:
+        identifier: Bedrock item identifier.
+        material: Bedrock material name for rendering.
+        atlas_filename: Filename of the atlas texture in textures/ folder.
+        geometry_identifier: Geometry identifier string.
+
+    Returns:
+        Encoded attachable JSON, ready to be written to disk.
+    """
+    if not geometry_identifier.startswith(_GEOMETRY_PREFIX):
+        return fastjson.dumps(
+            create_3d_attachable_definition(identifier, material, atlas_filename, geometry_identifier)
+        )
+
+    # Encoding each value as a JSON string keeps quotes and backslashes escaped
+    values = {
+        b"__IDENT__": fastjson.dumps(identifier)[1:-1],
+        b"__MAT__": fastjson.dumps(material)[1:-1],
+        b"__ATLAS__": fastjson.dumps(atlas_filename)[1:-1],
+        b"__GEO__": fastjson.dumps(geometry_identifier[len(_GEOMETRY_PREFIX):])[1:-1],
+    }
+    return _ATTACHABLE_FIELD.sub(lambda match: values[match.group()], _ATTACHABLE_TEMPLATE)
+
+
 def generate_item_animations(geometry_id: str, display: dict[str, Any]) -> dict[str, Any]:
     """
     Generate Bedrock animations based on Java display settings.
@@ -245,189 +420,48 @@ def generate_item_animations(geometry_id: str, display: dict[str, Any]) -> dict[
         Animation definition dictionary.
     """
     anim_prefix = f"animation.geyser_custom.{geometry_id}"
-    
     animations = {}
 
-    # Helper to safely get values
-    def get_val(data, key, default=None):
-        return data.get(key, default)
-
-    # 1. Third Person Main Hand (Right)
-    # converter.sh: base rot=[90, 0, 0], pos=[0, 13, -3]
-    # child pos=[-x, y, z], rot=[-x, -y, z]
-    disp = display.get("thirdperson_righthand", {})
-    j_rot = get_val(disp, "rotation", [0, 0, 0])
-    j_pos = get_val(disp, "translation", [0, 0, 0])
-    j_scale = get_val(disp, "scale", [1, 1, 1])
-
-    animations[f"{anim_prefix}.thirdperson_main_hand"] = {
-        "loop": True,
-        "bones": {
-            "geyser_custom": {
-                "rotation": [90, 0, 0],
-                "position": [0, 13, -3]
-            },
-            "geyser_custom_x": {
-                "rotation": [-j_rot[0], 0, 0],
-                "position": [-j_pos[0], j_pos[1], j_pos[2]],
-                "scale": j_scale
-            },
-            "geyser_custom_y": {
-                "rotation": [0, -j_rot[1], 0]
-            },
-            "geyser_custom_z": {
-                "rotation": [0, 0, j_rot[2]]
-            }
-        }
-    }
+    for suffix, slot, root_bone, mirror_x, mirror_z, factor, missing_rotation in _ANIMATION_SLOTS:
+        disp = display.get(slot, {})
+        j_pos = disp.get("translation", _ZERO3)
+        position = [-j_pos[0] if mirror_x else j_pos[0], j_pos[1], -j_pos[2] if mirror_z else j_pos[2]]
+        if factor is None:
+            j_scale = disp.get("scale", _UNIT_SCALE)
+        else:
+            # converter.sh scales the head by 0.625, or uses 0.625 when Java has no scale
+            position = [value * factor for value in position]
+            j_scale = [s * factor for s in disp["scale"]] if "scale" in disp else _HEAD_DEFAULT_SCALE
 
-    # 2. Third Person Off Hand (Left)
-    # converter.sh: base rot=[90, 0, 0], pos=[0, 13, -3]
-    # child pos=[x, y, z], rot=[-x, -y, z]
-    disp = display.get("thirdperson_lefthand", {})
-    j_rot = get_val(disp, "rotation", [0, 0, 0])
-    j_pos = get_val(disp, "translation", [0, 0, 0])
-    j_scale = get_val(disp, "scale", [1, 1, 1])
-
-    animations[f"{anim_prefix}.thirdperson_off_hand"] = {
-        "loop": True,
-        "bones": {
-            "geyser_custom": {
-                "rotation": [90, 0, 0],
-                "position": [0, 13, -3]
-            },
-            "geyser_custom_x": {
-                "rotation": [-j_rot[0], 0, 0],
-                "position": [j_pos[0], j_pos[1], j_pos[2]],
-                "scale": j_scale
-            },
-            "geyser_custom_y": {
-                "rotation": [0, -j_rot[1], 0]
-            },
-            "geyser_custom_z": {
-                "rotation": [0, 0, j_rot[2]]
-            }
-        }
-    }
+        if missing_rotation is None or "rotation" in disp:
+            j_rot = disp.get("rotation", _ZERO3)
+            rot_x = [-j_rot[0], 0, 0]
+        else:
+            # converter.sh puts [0.1, 0.1, 0.1] on the x bone and leaves out y and z
+            j_rot = None
+            rot_x = missing_rotation
 
-    # 3. Head
-    # converter.sh: base pos=[0, 19.9, 0]
-    # child pos=[-x*0.625, y*0.625, z*0.625], rot=[-x, -y, z]
-    # child scale = scale * 0.625 (or 0.625 if no scale)
-    disp = display.get("head", {})
-    j_rot = get_val(disp, "rotation", [0, 0, 0])
-    j_pos = get_val(disp, "translation", [0, 0, 0])
-    raw_scale = get_val(disp, "scale", [1, 1, 1])
-
-    # If scale was missing in Java, converter.sh uses 0.625. 
-    # If present, it multiplies by 0.625.
-    # We can simulate this by checking if "scale" key exists, but here we have defaults.
-    # Let's assume if it's [1,1,1] it might be default, but Java JSON might omit it.
-    # Ideally we check if key exists.
-    if "scale" in disp:
-        j_scale = [s * 0.625 for s in raw_scale]
-    else:
-        j_scale = [0.625, 0.625, 0.625]
-
-    animations[f"{anim_prefix}.head"] = {
-        "loop": True,
-        "bones": {
-            "geyser_custom": {
-                "position": [0, 19.9, 0]
-            },
+        bones = {
+            "geyser_custom": root_bone,
             "geyser_custom_x": {
-                "rotation": [-j_rot[0], 0, 0],
-                "position": [-j_pos[0] * 0.625, j_pos[1] * 0.625, j_pos[2] * 0.625],
+                "rotation": rot_x,
+                "position": position,
                 "scale": j_scale
-            },
-            "geyser_custom_y": {
-                "rotation": [0, -j_rot[1], 0]
-            },
-            "geyser_custom_z": {
-                "rotation": [0, 0, j_rot[2]]
             }
         }
-    }
-
-    # 4. First Person Main Hand (Right)
-    # converter.sh: base rot=[90, 60, -40], pos=[4, 10, 4], scale=1.5
-    # child pos=[-x, y, -z], rot=[-x, -y, z] (default rot [0.1, 0.1, 0.1] if missing)
-    disp = display.get("firstperson_righthand", {})
-    # converter.sh default rotation is [0.1, 0.1, 0.1] if missing.
-    if "rotation" in disp:
-        j_rot = disp["rotation"]
-        rot_x = [-j_rot[0], 0, 0]
-    else:
-        # converter.sh uses [0.1, 0.1, 0.1] if rotation is null.
-        # But wait, it puts it in 'rotation' field of geyser_custom_x.
-        # If rotation is null, it sets rotation to [0.1, 0.1, 0.1].
-        # This seems to be a specific hack.
-        rot_x = [0.1, 0.1, 0.1]
-        j_rot = [0, 0, 0] # For y and z components if they are used?
-        # converter.sh: geyser_custom_y rotation is null if rotation is null.
-        # So only X gets the 0.1s? No, the array is [0.1, 0.1, 0.1].
-    
-    j_pos = get_val(disp, "translation", [0, 0, 0])
-    j_scale = get_val(disp, "scale", [1, 1, 1])
-
-    # Construct bones for FP Right
-    bones_fp_right = {
-        "geyser_custom": {
-            "rotation": [90, 60, -40],
-            "position": [4, 10, 4],
-            "scale": 1.5
-        },
-        "geyser_custom_x": {
-            "rotation": rot_x,
-            "position": [-j_pos[0], j_pos[1], -j_pos[2]],
-            "scale": j_scale
-        }
-    }
-    if "rotation" in disp:
-        bones_fp_right["geyser_custom_y"] = {"rotation": [0, -j_rot[1], 0]}
-        bones_fp_right["geyser_custom_z"] = {"rotation": [0, 0, j_rot[2]]}
+        if j_rot is not None:
+            bones["geyser_custom_y"] = {"rotation": [0, -j_rot[1], 0]}
+            bones["geyser_custom_z"] = {"rotation": [0, 0, j_rot[2]]}
 
-    animations[f"{anim_prefix}.firstperson_main_hand"] = {
-        "loop": True,
-        "bones": bones_fp_right
-    }
-
-    # 5. First Person Off Hand (Left)
-    # converter.sh: base rot=[90, 60, -40], pos=[4, 10, 4], scale=1.5
-    # child pos=[x, y, -z], rot=[-x, -y, z]
-    disp = display.get("firstperson_lefthand", {})
-    if "rotation" in disp:
-        j_rot = disp["rotation"]
-        rot_x = [-j_rot[0], 0, 0]
-    else:
-        rot_x = [0.1, 0.1, 0.1]
-        j_rot = [0, 0, 0]
-
-    j_pos = get_val(disp, "translation", [0, 0, 0])
-    j_scale = get_val(disp, "scale", [1, 1, 1])
-
-    bones_fp_left = {
-        "geyser_custom": {
-            "rotation": [90, 60, -40],
-            "position": [4, 10, 4],
-            "scale": 1.5
-        },
-        "geyser_custom_x": {
-            "rotation": rot_x,
-            "position": [j_pos[0], j_pos[1], -j_pos[2]],
-            "scale": j_scale
+        animations[f"{anim_prefix}.{suffix}"] = {
+            "loop": True,
+            "bones": bones
         }
-    }
-    if "rotation" in disp:
-        bones_fp_left["geyser_custom_y"] = {"rotation": [0, -j_rot[1], 0]}
-        bones_fp_left["geyser_custom_z"] = {"rotation": [0, 0, j_rot[2]]}
-
-    animations[f"{anim_prefix}.firstperson_off_hand"] = {
-        "loop": True,
-        "bones": bones_fp_left
-    }
 
     return {
         "format_version": "1.8.0",
         "animations": animations
-    }
\ No newline at end of file
+    }
+
+# Animations of a model without display settings, encoded once with a placeholder id
+_DEFAULT_ANIMATIONS_TEMPLATE = fastjson.dumps(generate_item_animations("__GEO__", {}))
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import copy
-import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, MutableMapping, Optional, Set
 
 from services.texture_utils import resolve_texture_files, split_namespace
+from utils import fastjson
 
 _GENERATED_PARENT_KEYS = {
     "builtin/generated",
@@ -20,17 +21,19 @@ _CUBE_PARENT_KEYS = {
     "block/cube_all",
 }
 
-_DEFAULT_CUBE_ALL = [
-    {
-        "name": "cube",
-        "from": [0, 0, 0],
-        "to": [16, 16, 16],
-        "faces": {
-            face: {"texture": "#all"}
-            for face in ("north", "south", "east", "west", "up", "down")
-        },
-    }
-]
+_CUBE_FACES = ("north", "south", "east", "west", "up", "down")
+
+
+def _default_cube_all() -> list[dict[str, Any]]:
+    """Build a fresh copy of the single full-block cube `block/cube_all` implies."""
+    return [
+        {
+            "name": "cube",
+            "from": [0, 0, 0],
+            "to": [16, 16, 16],
+            "faces": {face: {"texture": "#all"} for face in _CUBE_FACES},
+        }
+    ]
 
 
 def resolve_parental(
@@ -41,6 +44,8 @@ def resolve_parental(
     Resolve a Java model's inheritance chain until concrete geometry and textures exist.
 
     Walks up the parent chain, merging textures, elements, and display settings.
+    Model files are parsed once per process (see `_load_model`), so the returned
+    elements and display settings may be shared and must not be mutated.
 
     Args:
         model_path: Absolute path to the JSON model definition inside the extracted Java pack.
@@ -62,21 +67,22 @@ def resolve_parental(
         ValueError: If a parental loop is detected or no geometry/textures could be resolved.
     """
     assets_root = assets_root or model_path.parents[3]
-    current = Path(model_path)
-    visited: Set[Path] = set()
+    # Strings hash and compare cheaper than Path objects for the visited checks
+    current = str(model_path)
+    visited: Set[str] = set()
     parent_chain: list[str] = []
     resolved_elements: Optional[list[Any]] = None
     resolved_display: Optional[dict[str, Any]] = None
     resolved_textures: MutableMapping[str, str] = {}
     generated_model = False
+    model = _load_model(current)
 
     while True:
         if current in visited:
             raise ValueError(f"Circular parent reference detected for {model_path}")
         
         visited.add(current)
-        parent_chain.append(str(current))
-        model = json.loads(current.read_text(encoding="utf-8"))
+        parent_chain.append(current)
 
         if resolved_elements is None and "elements" in model:
             resolved_elements = model["elements"]
@@ -102,14 +108,15 @@ def resolve_parental(
             break
 
         if normalized_parent in _CUBE_PARENT_KEYS:
-            resolved_elements = copy.deepcopy(_DEFAULT_CUBE_ALL)
+            resolved_elements = _default_cube_all()
             break
 
-        parent_path = parent_to_model_path(parent, assets_root)
-        if not parent_path.exists():
-            raise FileNotFoundError(f"Missing parent model {parent} for {model_path}")
-
-        current = parent_path
+        current = str(parent_to_model_path(parent, assets_root))
+        # The stat that keys the parse cache doubles as the existence check
+        try:
+            model = _load_model(current)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Missing parent model {parent} for {model_path}") from None
 
     if resolved_elements is None and not generated_model:
         raise ValueError(f"Model {model_path} has no geometry even after resolving parents")
@@ -126,10 +133,36 @@ def resolve_parental(
     }
 
 
+def _load_model(path: str) -> dict[str, Any]:
+    """Parse a model JSON file, reusing the result while the file is unchanged."""
+    return _load_model_cached(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=2048)
+def _load_model_cached(path: str, mtime_ns: int) -> dict[str, Any]:
+    """
+    Parse a model JSON file, memoized per path and modification time.
+
+    Shared parents such as `item/handheld` or `block/cube_all` sit in the chain of
+    many models, so each one is parsed once instead of once per child.
+
+    Args:
+        path: Path of the model JSON file.
+        mtime_ns: Modification time of `path`, part of the cache key.
+
+    Returns:
+        The parsed model, shared between callers.
+    """
+    return fastjson.load(path)
+
+
+@lru_cache(maxsize=4096)
 def parent_to_model_path(parent: str, assets_root: Path) -> Path:
     """
     Convert a parent model reference to a filesystem path.
 
+    Memoized, since a handful of parents are referenced by most models of a pack.
+
     Args:
         parent: Parent model identifier (e.g., "minecraft:item/handheld").
         assets_root: Root directory containing the assets folder.
@@ -141,6 +174,7 @@ def parent_to_model_path(parent: str, assets_root: Path) -> Path:
     return assets_root / "assets" / namespace / "models" / f"{path}.json"
 
 
+@lru_cache(maxsize=4096)
 def _normalize_parent_name(parent: str) -> str:
     """Strip namespace prefixes so builtin detection stays consistent."""
 
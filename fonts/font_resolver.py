@@ -1,5 +1,8 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import math
+import os
 from PIL import Image
 
 def is_bedrock_glyph(glyph_name: str) -> bool:
@@ -13,6 +16,21 @@ def is_bedrock_glyph(glyph_name: str) -> bool:
     """
     return ord(glyph_name[0]) >= 0xE000 and ord(glyph_name[0]) <= 0xF8FF
 
+def _decode_glyph(abs_path: Path) -> Image.Image | Exception:
+    """
+    Decodes a glyph texture to RGBA.
+
+    Args:
+        abs_path (Path): The path of the glyph PNG.
+    Returns:
+        Image.Image | Exception: The decoded image, or the error raised while reading it.
+    """
+    try:
+        with Image.open(abs_path) as img:
+            return img.convert("RGBA")
+    except Exception as e:
+        return e
+
 def generate_bedrock_glyph_font_file(
     pack_root: Path,
     font_file: Path,
@@ -26,10 +44,8 @@ def generate_bedrock_glyph_font_file(
         font_file (Path): The path to the font file to generate.
         glyphs (Dict[str, str]): A dictionary of char_id -> texture_path.
     """
-    # 1. Resolve paths and determine dimensions
-    resolved_textures = {}
-    max_w, max_h = 0, 0
-    
+    # 1. Resolve paths, decode each glyph once and determine dimensions
+    glyph_paths = {}
     for char_id, tex_path in glyphs.items():
         # Resolve texture path: namespace:path/to/tex -> assets/namespace/textures/path/to/tex.png
         if ":" in tex_path:
@@ -43,49 +59,49 @@ def generate_bedrock_glyph_font_file(
         abs_path = pack_root / "assets" / namespace / "textures" / path
         
         if abs_path.exists():
-            try:
-                with Image.open(abs_path) as img:
-                    w, h = img.size
-                    max_w = max(max_w, w)
-                    max_h = max(max_h, h)
-                    resolved_textures[char_id] = abs_path
-            except Exception as e:
-                print(f"Failed to read texture {abs_path}: {e}")
+            glyph_paths[char_id] = abs_path
         else:
             print(f"Texture not found: {abs_path}")
 
+    # Pillow releases the GIL while decoding, so glyphs decode in parallel threads
+    with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1)) as executor:
+        decoded = list(executor.map(_decode_glyph, glyph_paths.values()))
+
+    resolved_textures = {}
+    max_w, max_h = 0, 0
+    for (char_id, abs_path), glyph in zip(glyph_paths.items(), decoded):
+        if isinstance(glyph, Exception):
+            print(f"Failed to read texture {abs_path}: {glyph}")
+            continue
+        w, h = glyph.size
+        max_w = max(max_w, w)
+        max_h = max(max_h, h)
+        resolved_textures[char_id] = glyph
+
     if not resolved_textures:
         return
 
     # 2. Calculate sheet dimensions (Power of 2)
-    # Determine the largest dimension to ensure square cells
-    max_dim = max(max_w, max_h)
-    raw_sheet_size = max_dim * 16
-    
-    # Calculate next power of 2 for the whole sheet
-    sheet_size = 2 ** math.ceil(math.log2(raw_sheet_size)) if raw_sheet_size > 0 else 16
-    
-    # Ensure minimum size
-    sheet_size = max(sheet_size, 16)
+    # Bedrock stretches glyph sheets over a square 16x16 grid, so cells stay square
+    max_dim = max(max_w, max_h, 1)
 
-    cell_w = sheet_size // 16
-    cell_h = sheet_size // 16
+    # Next power of 2 in integer arithmetic; the sheet is 16 of these cells wide
+    cell_w = cell_h = 1 << (max_dim - 1).bit_length()
+    sheet_size = cell_w * 16
 
     # 3. Create and populate atlas
     atlas = Image.new("RGBA", (sheet_size, sheet_size), (0, 0, 0, 0))
     
-    for char_id, abs_path in resolved_textures.items():
+    for char_id, glyph in resolved_textures.items():
         # char_id is hex "XY" where X=row, Y=col
         try:
-            row = int(char_id[0], 16)
-            col = int(char_id[1], 16)
+            row, col = divmod(int(char_id, 16), 16)
             
             x = col * cell_w
             y = row * cell_h
             
-            with Image.open(abs_path) as img:
-                # Paste at top-left of the cell
-                atlas.paste(img, (x, y))
+            # Paste at top-left of the cell; without a mask this is a plain copy
+            atlas.paste(glyph, (x, y))
         except Exception as e:
             print(f"Error processing glyph {char_id}: {e}")
 
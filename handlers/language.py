@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
-import shutil
 from pathlib import Path
 from typing import List, Tuple
 
+from utils import fastjson
+
+_LANGUAGES_JSON = fastjson.dumps(["en_US", "en_GB"])
+
 
 def write_language_files(texts_dir: Path, lang_entries: List[Tuple[str, str]]) -> None:
     """
@@ -25,13 +27,12 @@ def write_language_files(texts_dir: Path, lang_entries: List[Tuple[str, str]]) -
     
     lines = [f"item.geyser_custom:{key}.name={value}" for key, value in lang_entries]
     
-    (texts_dir / "en_US.lang").write_text("\n".join(lines), encoding="utf-8")
-    shutil.copy2(texts_dir / "en_US.lang", texts_dir / "en_GB.lang")
+    # Both locales get the same text, so encode it once instead of copying the file back
+    data = "\n".join(lines).encode("utf-8")
+    (texts_dir / "en_US.lang").write_bytes(data)
+    (texts_dir / "en_GB.lang").write_bytes(data)
     
-    (texts_dir / "languages.json").write_text(
-        json.dumps(["en_US", "en_GB"]), 
-        encoding="utf-8"
-    )
+    (texts_dir / "languages.json").write_bytes(_LANGUAGES_JSON)
 
 
 def format_display_name(item_id: str, cmd: int) -> str:
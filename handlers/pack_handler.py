@@ -2,28 +2,45 @@
 
 from __future__ import annotations
 
-import json
+import os
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
+from utils import fastjson
+
 
 def locate_pack_root(extracted_root: Path) -> Optional[Path]:
     """
     Find the root directory of a Minecraft resource pack.
 
-    Looks for pack.mcmeta to identify the pack root.
+    Looks for pack.mcmeta to identify the pack root. Directories are searched
+    breadth-first with `os.scandir` and the search stops at the first match, so
+    the textures and models of a pack are never walked once its root is found.
 
     Args:
         extracted_root: Root directory where the pack was extracted.
 
     Returns:
-        Path to the pack root, or None if not found.
+        Path to the shallowest directory containing pack.mcmeta, or None if not found.
     """
-    if (extracted_root / "pack.mcmeta").exists():
-        return extracted_root
-    
-    candidates = list(extracted_root.glob("**/pack.mcmeta"))
-    return candidates[0].parent if candidates else None
+    pending = deque([os.fspath(extracted_root)])
+    while pending:
+        directory = pending.popleft()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            if entry.name == "pack.mcmeta" and entry.is_file():
+                return Path(directory)
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+        pending.extend(subdirectories)
+    return None
 
 
 def read_pack_description(mcmeta_path: Path) -> str:
@@ -37,7 +54,7 @@ def read_pack_description(mcmeta_path: Path) -> str:
         Pack description string, or a default if not found.
     """
     try:
-        data = json.loads(mcmeta_path.read_text(encoding="utf-8"))
+        data = fastjson.load(mcmeta_path)
         return data.get("pack", {}).get("description", "Converted Resource Pack")
     except Exception:
         return "Converted Resource Pack"
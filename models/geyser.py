@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-import json
 from collections import defaultdict
 from pathlib import Path
 from typing import Any, Iterable, Mapping
 
+from utils import fastjson
 
-def write_geyser_item_mappings(entries: Iterable[Mapping[str, Any]], output_path: Path) -> None:
+
+def write_geyser_item_mappings(
+    entries: Iterable[Mapping[str, Any]],
+    output_path: Path,
+    pretty: bool = False,
+) -> None:
     """
     Emit geyser_mappings.json compatible with Geyser's custom item definitions.
 
@@ -16,6 +21,7 @@ def write_geyser_item_mappings(entries: Iterable[Mapping[str, Any]], output_path
         entries: Iterable of config dictionaries containing at minimum 
                  `item`, `path_hash`, `generated`, `bedrock_icon`, and `nbt`.
         output_path: Destination JSON file (typically `target/geyser_mappings.json`).
+        pretty: Indent the JSON output for debugging. Geyser does not need it.
 
     Returns:
         None. Writes the mappings file to disk.
@@ -27,17 +33,15 @@ def write_geyser_item_mappings(entries: Iterable[Mapping[str, Any]], output_path
         if item_id is None:
             continue
         
-        java_id = item_id if ":" in item_id else f"minecraft:{item_id}"
-        bedrock_name = f"minecraft:{java_id.split(':')[-1]}"
+        bedrock_name = f"minecraft:{item_id.rpartition(':')[2]}"
         
+        path_hash = entry["path_hash"]
         payload: dict[str, Any] = {
-            "name": entry["path_hash"],
+            "name": path_hash,
             "allow_offhand": True,
+            "icon": path_hash,
         }
 
-        icon_info = entry.get("bedrock_icon", {})
-        payload["icon"] = entry["path_hash"]
-
         nbt = entry.get("nbt", {}) or {}
         if "CustomModelData" in nbt:
             payload["custom_model_data"] = nbt["CustomModelData"]
@@ -54,5 +58,5 @@ def write_geyser_item_mappings(entries: Iterable[Mapping[str, Any]], output_path
     }
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(geyser_json), encoding="utf-8")
+    fastjson.dump(geyser_json, output_path, pretty=pretty)
 
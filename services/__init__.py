@@ -1,7 +1,7 @@
 """Service modules for complex operations."""
 
 from .pack_builder import build_pack_manifests
-from .texture_atlas import generate_atlas
+from .texture_atlas import generate_atlas, generate_shared_atlas
 from .texture_utils import (
     resolve_texture_files,
     ensure_placeholder_texture,
@@ -11,6 +11,7 @@ from .texture_utils import (
 __all__ = [
     "build_pack_manifests",
     "generate_atlas",
+    "generate_shared_atlas",
     "resolve_texture_files",
     "ensure_placeholder_texture",
     "resolve_texture_value",
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Mapping
 
+from utils import fastjson
 from utils.logging import status_message
 
+_DEFAULT_VERSION = (1, 0, 0)
+_DEFAULT_MIN_ENGINE_VERSION = (1, 18, 3)
+
 
 def build_pack_manifests(meta: Mapping[str, Any], rp_dir: Path) -> None:
     """
@@ -39,10 +42,11 @@ def build_pack_manifests(meta: Mapping[str, Any], rp_dir: Path) -> None:
     rp_dir = Path(rp_dir)
     rp_dir.mkdir(parents=True, exist_ok=True)
 
-    version = list(meta.get("version", [1, 0, 0]))
-    min_engine_version = list(meta.get("min_engine_version", [1, 18, 3]))
+    # Tuples and lists serialize identically, so caller values are used as-is
+    version = meta.get("version", _DEFAULT_VERSION)
+    min_engine_version = meta.get("min_engine_version", _DEFAULT_MIN_ENGINE_VERSION)
     description = meta.get("description", "Adds 3D items for use with a Geyser proxy")
-    pack_name = meta.get("name", meta.get("pack_desc", description))
+    pack_name = meta["name"] if "name" in meta else meta.get("pack_desc", description)
 
     rp_manifest = {
         "format_version": 2,
@@ -63,6 +67,6 @@ def build_pack_manifests(meta: Mapping[str, Any], rp_dir: Path) -> None:
         ],
     }
 
-    (rp_dir / "manifest.json").write_text(json.dumps(rp_manifest))
+    fastjson.dump(rp_manifest, rp_dir / "manifest.json")
 
     status_message("completion", "Generated Bedrock manifest scaffolding")
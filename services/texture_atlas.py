@@ -2,8 +2,26 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Mapping, Any
+from typing import Hashable, Mapping, Any, TypeVar
+
+from utils.file_ops import ensure_directory
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SetKey = TypeVar("SetKey", bound=Hashable)
+# zlib level for atlas PNGs: level 1 encodes several times faster than Pillow's
+# default 6 for a slightly larger file, which the pack zip stores as-is anyway
+_PNG_COMPRESS_LEVEL = 1
+# Largest shared atlas side; many Bedrock clients, mobile GPUs in particular,
+# cannot load larger textures
+_MAX_ATLAS_SIZE = 4096
 
 
 def generate_atlas(
@@ -14,20 +32,22 @@ def generate_atlas(
     """
     Generate a single PNG atlas for all textures required by one model.
 
-    The atlas is built as a simple vertical strip (one texture per row). 
-    This keeps the packing logic deterministic without requiring external CLI tools.
+    Textures are placed with a guillotine rectangle packer (see `pack_rectangles`),
+    which keeps the layout deterministic without requiring external CLI tools.
 
     Args:
         texture_files: Mapping from texture keys (model identifiers) to PNG file paths.
-        output_dir: Directory inside the Bedrock resource pack where the atlas PNG 
+        output_dir: Directory inside the Bedrock resource pack where the atlas PNG
                     should be written.
-        atlas_name: Friendly name (typically the model hash) used for both the PNG 
+        atlas_name: Friendly name (typically the model hash) used for both the PNG
                     file name and the resource identifier.
 
     Returns:
         Tuple of (atlas_key, frames, atlas_path, atlas_size):
         - atlas_key: String like `gmdl_atlas_<atlas_name>` used in Bedrock JSON.
         - frames: Mapping of texture key to frame metadata `{x, y, w, h}` in pixels.
+          Keys that point to the same PNG share one frame dict, so treat frames
+          as read-only.
         - atlas_path: Absolute Path to the generated PNG file.
         - atlas_size: (width, height) tuple in pixels.
 
@@ -37,18 +57,12 @@ def generate_atlas(
     if not texture_files:
         raise RuntimeError("No textures supplied for atlas generation")
 
-    try:
-        from PIL import Image
-    except ImportError as exc:
-        raise RuntimeError(
-            "Pillow is required to generate atlases (pip install Pillow)"
-        ) from exc
-
-    output_dir.mkdir(parents=True, exist_ok=True)
+    _require_pillow()
+    # Every item atlas lands in the same directory, so only the first call creates it
+    ensure_directory(output_dir)
 
     # Deduplicate textures that point to the same PNG file so a single
-    # 16x16 source texture does not get stacked multiple times (which would
-    # incorrectly produce 16x32, 16x48, ... atlases).
+    # 16x16 source texture does not get packed multiple times.
     unique_entries: list[dict[str, Any]] = []
     image_cache: dict[Path, dict[str, Any]] = {}
 
@@ -56,34 +70,323 @@ def generate_atlas(
         canonical_path = Path(path).resolve()
         cached = image_cache.get(canonical_path)
         if cached is None:
-            img = Image.open(canonical_path).convert("RGBA")
+            img = _open_rgba(canonical_path)
             cached = {"image": img, "keys": []}
             image_cache[canonical_path] = cached
             unique_entries.append(cached)
         cached["keys"].append(key)
 
-    max_width = 0
-    total_height = 0
-    for entry in unique_entries:
-        img = entry["image"]
-        max_width = max(max_width, img.width)
-        total_height += img.height
-
-    atlas_image = Image.new("RGBA", (max_width, total_height), (0, 0, 0, 0))
+    atlas_image, placements = _compose_atlas([entry["image"] for entry in unique_entries])
     frames: dict[str, dict[str, float]] = {}
-    cursor_y = 0
-
-    for entry in unique_entries:
-        img = entry["image"]
-        atlas_image.paste(img, (0, cursor_y))
-        frame = {"x": 0, "y": cursor_y, "w": img.width, "h": img.height}
+    for entry, frame in zip(unique_entries, placements):
         for key in entry["keys"]:
-            frames[key] = frame.copy()
-        cursor_y += img.height
-        img.close()
+            frames[key] = frame
 
     atlas_path = output_dir / f"{atlas_name}.png"
-    atlas_image.save(atlas_path)
+    # Worker processes may write the same shared atlas at once; replacing a
+    # private temporary file keeps readers from ever seeing a partial PNG
+    temp_path = atlas_path.with_name(f".{atlas_path.name}.{os.getpid()}")
+    _save_png(atlas_image, temp_path)
+    os.replace(temp_path, atlas_path)
 
     atlas_key = f"gmdl_atlas_{atlas_name}"
     return atlas_key, frames, atlas_path, atlas_image.size
+
+
+def generate_shared_atlas(
+    texture_sets: Mapping[SetKey, Mapping[str, Path]],
+    output_dir: Path,
+    atlas_name: str,
+    max_size: int = _MAX_ATLAS_SIZE,
+) -> dict[SetKey, tuple[str, dict[str, dict[str, float]], Path, tuple[int, int]]]:
+    """
+    Pack the textures of many models into shared PNG atlases.
+
+    Every unique PNG across all sets is decoded (on a thread pool) and packed once
+    per atlas, so models that reuse textures share the same atlas region. Sets go
+    into a single atlas when it fits within `max_size` on both sides; otherwise
+    they spill, in order, into extra atlases named `<atlas_name>_1`,
+    `<atlas_name>_2`, ... A set never spans two atlases.
+
+    Args:
+        texture_sets: Mapping from an arbitrary set key (e.g. a block variant) to
+                      that model's texture keys and PNG file paths.
+        output_dir: Directory inside the Bedrock resource pack where the atlas PNGs
+                    should be written.
+        atlas_name: Friendly name used for both the PNG file name and the
+                    resource identifier of the first atlas.
+        max_size: Largest width or height of one atlas, in pixels. A single set
+                  larger than this still gets an atlas of its own.
+
+    Returns:
+        Mapping from set key to the same (atlas_key, frames, atlas_path, atlas_size)
+        tuple `generate_atlas` returns, for the atlas holding that set, with frames
+        limited to that set's keys. Frames of the same PNG are shared across keys
+        and sets of one atlas. Sets that are empty or reference a missing or
+        undecodable PNG are left out.
+
+    Raises:
+        RuntimeError: If Pillow is not installed.
+    """
+    _require_pillow()
+
+    resolved_sets = {
+        set_key: {key: Path(path).resolve() for key, path in texture_files.items()}
+        for set_key, texture_files in texture_sets.items()
+        if texture_files
+    }
+    unique_paths = list(dict.fromkeys(path for canonical in resolved_sets.values() for path in canonical.values()))
+    # Pillow releases the GIL while decoding, so the PNGs decode in parallel threads
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(unique_paths)))) as executor:
+        decoded = dict(zip(unique_paths, executor.map(_try_open_rgba, unique_paths)))
+
+    images: dict[Path, Any] = {path: img for path, img in decoded.items() if img is not None}
+    canonical_sets: dict[SetKey, dict[str, Path]] = {
+        set_key: canonical
+        for set_key, canonical in resolved_sets.items()
+        if all(path in images for path in canonical.values())
+    }
+
+    if not canonical_sets:
+        return {}
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    results: dict[SetKey, tuple[str, dict[str, dict[str, float]], Path, tuple[int, int]]] = {}
+    for page, page_sets in enumerate(_paginate_sets(canonical_sets, images, max_size)):
+        # Only pack images that belong to at least one set of this atlas
+        used_paths = list(dict.fromkeys(path for set_key in page_sets for path in canonical_sets[set_key].values()))
+        atlas_image, placements = _compose_atlas([images[path] for path in used_paths])
+        path_frames = dict(zip(used_paths, placements))
+
+        page_name = atlas_name if page == 0 else f"{atlas_name}_{page}"
+        atlas_path = output_dir / f"{page_name}.png"
+        _save_png(atlas_image, atlas_path)
+
+        atlas_key = f"gmdl_atlas_{page_name}"
+        for set_key in page_sets:
+            results[set_key] = (
+                atlas_key,
+                {key: path_frames[path] for key, path in canonical_sets[set_key].items()},
+                atlas_path,
+                atlas_image.size,
+            )
+    return results
+
+
+def _paginate_sets(
+    canonical_sets: Mapping[SetKey, Mapping[str, Path]],
+    images: Mapping[Path, Any],
+    max_size: int,
+) -> list[list[SetKey]]:
+    """
+    Group texture sets, in order, into atlases that each fit within `max_size`.
+
+    The common case of everything fitting costs one packing pass. Otherwise sets
+    are added greedily and each atlas is closed when the next set would push it
+    past `max_size`.
+
+    Args:
+        canonical_sets: Mapping from set key to its resolved PNG paths.
+        images: Decoded images of every path in `canonical_sets`.
+        max_size: Largest width or height of one atlas, in pixels.
+
+    Returns:
+        Set keys of each atlas, in input order.
+    """
+    set_keys = list(canonical_sets)
+    all_paths = dict.fromkeys(path for canonical in canonical_sets.values() for path in canonical.values())
+    if _fits_atlas([images[path].size for path in all_paths], max_size):
+        return [set_keys]
+
+    pages: list[list[SetKey]] = []
+    page_sets: list[SetKey] = []
+    page_paths: dict[Path, None] = {}
+    for set_key in set_keys:
+        candidate = {**page_paths, **dict.fromkeys(canonical_sets[set_key].values())}
+        if page_sets and not _fits_atlas([images[path].size for path in candidate], max_size):
+            pages.append(page_sets)
+            page_sets = []
+            candidate = dict.fromkeys(canonical_sets[set_key].values())
+        page_sets.append(set_key)
+        page_paths = candidate
+    pages.append(page_sets)
+    return pages
+
+
+def _fits_atlas(sizes: list[tuple[int, int]], max_size: int) -> bool:
+    """Return whether `pack_rectangles` places `sizes` within `max_size` on both sides."""
+    if sum(w * h for w, h in sizes) > max_size * max_size:
+        return False
+    _, (width, height) = pack_rectangles(sizes)
+    return width <= max_size and height <= max_size
+
+
+def pack_rectangles(sizes: list[tuple[int, int]]) -> tuple[list[tuple[int, int]], tuple[int, int]]:
+    """
+    Place rectangles without overlap using a guillotine bin packer.
+
+    Rectangles are inserted tallest first into a bin whose width is the next power
+    of two of the square root of the total area (or the widest rectangle). Each
+    placement picks the free rectangle that keeps the bottom edge lowest, then
+    splits the remaining space along its shorter axis and merges free rectangles
+    that share a full edge.
+
+    Args:
+        sizes: (width, height) of every rectangle, in pixels.
+
+    Returns:
+        Tuple of (positions, atlas_size): the (x, y) of each rectangle in input
+        order, and the (width, height) actually covered by the placements.
+    """
+    if not sizes:
+        return [], (0, 0)
+
+    total_area = sum(w * h for w, h in sizes)
+    side = max(1, int(total_area ** 0.5))
+    bin_width = max(max(w for w, _ in sizes), 1 << (side - 1).bit_length())
+    bin_height = sum(h for _, h in sizes)
+
+    free: list[tuple[int, int, int, int]] = [(0, 0, bin_width, bin_height)]
+    positions: list[tuple[int, int]] = [(0, 0)] * len(sizes)
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0], i))
+
+    for index in order:
+        w, h = sizes[index]
+        best = None
+        best_score = None
+        for free_index, (fx, fy, fw, fh) in enumerate(free):
+            if w > fw or h > fh:
+                continue
+            score = (fy + h, fw * fh - w * h, fx)
+            if best_score is None or score < best_score:
+                best, best_score = free_index, score
+        # The free rectangle touching the bottom of the bin always spans its full
+        # width and is at least as tall as the remaining rectangles, so a slot exists
+        fx, fy, fw, fh = free.pop(best)
+        positions[index] = (fx, fy)
+
+        if fw < fh or fy + fh == bin_height:
+            right = (fx + w, fy, fw - w, h)
+            below = (fx, fy + h, fw, fh - h)
+        else:
+            right = (fx + w, fy, fw - w, fh)
+            below = (fx, fy + h, w, fh - h)
+        free.extend(rect for rect in (right, below) if rect[2] > 0 and rect[3] > 0)
+        _merge_free_rectangles(free)
+
+    width = max(x + w for (x, _), (w, _) in zip(positions, sizes))
+    height = max(y + h for (_, y), (_, h) in zip(positions, sizes))
+    return positions, (width, height)
+
+
+def _merge_free_rectangles(free: list[tuple[int, int, int, int]]) -> None:
+    """Merge free rectangles that share a complete edge, in place."""
+    merged = True
+    while merged:
+        merged = False
+        for i in range(len(free)):
+            ax, ay, aw, ah = free[i]
+            for j in range(i + 1, len(free)):
+                bx, by, bw, bh = free[j]
+                if ax == bx and aw == bw and (ay + ah == by or by + bh == ay):
+                    free[i] = (ax, min(ay, by), aw, ah + bh)
+                elif ay == by and ah == bh and (ax + aw == bx or bx + bw == ax):
+                    free[i] = (min(ax, bx), ay, aw + bw, ah)
+                else:
+                    continue
+                del free[j]
+                merged = True
+                break
+            if merged:
+                break
+
+
+def _open_rgba(path: Path) -> Any:
+    """Return the decoded RGBA image of a PNG, reusing earlier decodes of the unchanged file."""
+    return _load_rgba(path, path.stat().st_mtime_ns)
+
+
+def _try_open_rgba(path: Path) -> Any:
+    """
+    Return `_open_rgba(path)`, or None if the PNG cannot be decoded.
+
+    Any decode failure counts, not only OSError: Pillow raises e.g.
+    `DecompressionBombError` for huge images, and one bad PNG must only exclude
+    the sets that use it rather than the whole shared atlas.
+    """
+    try:
+        return _open_rgba(path)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _load_rgba(path: Path, mtime_ns: int) -> Any:
+    """
+    Decode a PNG to RGBA, memoized per path and modification time.
+
+    Many items and block variants share textures, so each PNG is decoded once per
+    process instead of once per atlas. A changed mtime misses the cache. The
+    returned image is shared and must not be modified or closed.
+
+    Args:
+        path: Resolved PNG path.
+        mtime_ns: Modification time of `path`, part of the cache key.
+
+    Returns:
+        The decoded RGBA image.
+    """
+    Image = _require_pillow()
+    with Image.open(path) as img:
+        return img.convert("RGBA")
+
+
+def _compose_atlas(images: list[Any]) -> tuple[Any, list[dict[str, float]]]:
+    """Pack decoded RGBA images into a new atlas image and return it with their frames."""
+    Image = _require_pillow()
+    positions, (width, height) = pack_rectangles([img.size for img in images])
+    # Bedrock geometry needs a non-zero texture size, so never return an empty atlas
+    atlas_image = Image.new("RGBA", (max(1, width), max(1, height)), (0, 0, 0, 0))
+    frames: list[dict[str, float]] = []
+    for img, (x, y) in zip(images, positions):
+        atlas_image.paste(img, (x, y))
+        frames.append({"x": x, "y": y, "w": img.width, "h": img.height})
+    return atlas_image, frames
+
+
+def _save_png(image: Any, path: Path) -> None:
+    """
+    Write an RGBA atlas as PNG, as an indexed-color image when it fits a palette.
+
+    Item and block textures rarely use more than 256 distinct RGBA values, and an
+    exact palette stores one byte per pixel instead of four, so the PNG is smaller
+    and faster to encode. The palette carries alpha, so the image decodes to the
+    same RGBA pixels. Without NumPy, or with more colors, the atlas stays RGBA.
+
+    Args:
+        image: RGBA atlas image.
+        path: Destination PNG file.
+
+    Returns:
+        None. Writes the PNG to `path`.
+    """
+    if np is not None and image.getcolors(256) is not None:
+        Image = _require_pillow()
+        pixels = np.asarray(image)
+        colors, indices = np.unique(pixels.reshape(-1, 4).view(np.uint32).ravel(), return_inverse=True)
+        indexed = Image.fromarray(indices.astype(np.uint8).reshape(pixels.shape[:2]), "P")
+        indexed.putpalette(colors.view(np.uint8).tobytes(), rawmode="RGBA")
+        image = indexed
+    image.save(path, format="PNG", optimize=False, compress_level=_PNG_COMPRESS_LEVEL)
+
+
+@lru_cache(maxsize=None)
+def _require_pillow() -> Any:
+    """Import Pillow's Image module once, raising a helpful error if it is missing."""
+    try:
+        from PIL import Image
+    except ImportError as exc:
+        raise RuntimeError(
+            "Pillow is required to generate atlases (pip install Pillow)"
+        ) from exc
+    return Image
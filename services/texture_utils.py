@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import Mapping
+from typing import Mapping, Optional
 
 
 def resolve_texture_files(
@@ -21,8 +23,10 @@ def resolve_texture_files(
         Dictionary mapping texture keys to their resolved file Paths.
     """
     resolved: dict[str, Path] = {}
+    # Keys often alias a shared base (`#all`, `#particle`), so walk each chain once
+    memo: dict[str, str] = {}
     for key, value in textures.items():
-        texture_id = resolve_texture_value(value, textures)
+        texture_id = resolve_texture_value(value, textures, memo=memo)
         namespace, rel = split_namespace(texture_id)
         path = assets_root / "assets" / namespace / "textures" / f"{rel}.png"
         resolved[key] = path
@@ -32,40 +36,57 @@ def resolve_texture_files(
 def resolve_texture_value(
     value: str, 
     textures: Mapping[str, str], 
-    depth: int = 0
+    depth: int = 0,
+    memo: Optional[dict[str, str]] = None,
 ) -> str:
     """
-    Recursively resolve texture reference indirection.
+    Resolve texture reference indirection.
 
     Handles texture references that start with '#' which reference other texture keys.
 
     Args:
         value: Texture value or reference to resolve.
         textures: Full texture mapping for reference lookup.
-        depth: Current recursion depth (prevents infinite loops).
+        depth: Indirection depth already followed (prevents infinite loops).
+        memo: Optional cache of references already resolved against `textures`,
+              shared between calls for the same mapping.
 
     Returns:
         Fully resolved texture identifier.
 
     Raises:
-        ValueError: If recursion depth exceeds limit or reference cannot be resolved.
+        ValueError: If the indirection depth exceeds the limit or a reference cannot be resolved.
     """
-    if depth > 10:
-        raise ValueError("Exceeded texture indirection depth")
-    
-    if value.startswith("#"):
-        key = value[1:]
-        target = textures.get(key)
+    if memo is not None and value in memo:
+        return memo[value]
+
+    textures_get = textures.get
+    chain: list[str] = []
+    current = value
+    while True:
+        if depth > 10:
+            raise ValueError("Exceeded texture indirection depth")
+        if not current.startswith("#"):
+            break
+        if memo is not None and current in memo:
+            current = memo[current]
+            break
+        target = textures_get(current[1:])
         if target is None:
-            raise ValueError(f"Texture reference {value} could not be resolved")
-        return resolve_texture_value(target, textures, depth + 1)
-    
-    return value
+            raise ValueError(f"Texture reference {current} could not be resolved")
+        chain.append(current)
+        current = target
+        depth += 1
+
+    if memo is not None:
+        for reference in chain:
+            memo[reference] = current
+    return current
 
 def ensure_placeholder_texture(target: Path) -> None:
     """
     Create the built-in 16x16 texture (taken from the provided image) if it doesn't exist.
-    No external image file is required: pixels are embedded directly.
+    The image is read and encoded once per process; later calls only write the bytes.
     """
     if target.exists():
         return
@@ -76,14 +97,21 @@ def ensure_placeholder_texture(target: Path) -> None:
     if not source.exists():
         raise RuntimeError("The placeholder image was not found.")
 
+    target.write_bytes(_placeholder_png(source.resolve()))
+
+
+@lru_cache(maxsize=4)
+def _placeholder_png(source: Path) -> bytes:
+    """Encode the placeholder image as an RGBA PNG, memoized per source file."""
     try:
         from PIL import Image
     except ImportError as exc:
         raise RuntimeError("Pillow is required to write placeholder textures") from exc
 
-    img = Image.open(source).convert("RGBA")
-    img.save(target)
-
+    buffer = BytesIO()
+    with Image.open(source) as img:
+        img.convert("RGBA").save(buffer, format="PNG")
+    return buffer.getvalue()
 
 
 def split_namespace(resource: str, default_namespace: str = "minecraft") -> tuple[str, str]:
@@ -97,8 +125,7 @@ def split_namespace(resource: str, default_namespace: str = "minecraft") -> tupl
     Returns:
         Tuple of (namespace, path).
     """
-    if ":" in resource:
-        namespace, rest = resource.split(":", 1)
-    else:
+    namespace, sep, rest = resource.partition(":")
+    if not sep:
         namespace, rest = default_namespace, resource
     return namespace, rest.strip("/")
@@ -1,5 +1,6 @@
 from pathlib import Path
-import json
+
+from utils import fastjson
 
 def get_sounds_from_pack(java_root : Path) -> dict[str, list[str]]:
     """
@@ -26,13 +27,9 @@ def get_sounds_from_namespace(namespace : Path) -> dict[str, list[str]]:
     Returns:
         list: A list of sound file names.
     """
-    response: dict[str, list[str]] = {}
-    raw_sounds = (namespace / "sounds.json").open("r").read()
-    raw_sounds = json.loads(raw_sounds)
+    raw_sounds = fastjson.load(namespace / "sounds.json")
     namespace_name = namespace.name
-    for sound in raw_sounds.keys():
-        response[f"{namespace_name}:{sound}"] = raw_sounds[sound]
-    return response
+    return {f"{namespace_name}:{sound}": value for sound, value in raw_sounds.items()}
 
 
 def create_sound_mapping(mappings : dict[str, list[str]], output_path: Path):
@@ -53,5 +50,5 @@ def create_sound_mapping(mappings : dict[str, list[str]], output_path: Path):
     }
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(geyser_json), encoding="utf-8")
+    fastjson.dump(geyser_json, output_path)
 
@@ -0,0 +1,64 @@
+"""Tests for utils.file_ops."""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from utils.file_ops import extract_archive
+
+
+def _tree(root: Path) -> dict[str, bytes | None]:
+    """Map every path below root to its bytes, or None for directories."""
+    return {
+        path.relative_to(root).as_posix(): None if path.is_dir() else path.read_bytes()
+        for path in root.rglob("*")
+    }
+
+
+class ExtractArchiveTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.archive = self.root / "pack.zip"
+        with zipfile.ZipFile(self.archive, "w") as archive:
+            archive.writestr("pack.mcmeta", b"{}")
+            archive.writestr("assets/minecraft/", b"")
+            archive.writestr("assets/minecraft/models/item/stick.json", b'{"parent": "item/generated"}')
+            archive.writestr("assets/minecraft/textures/empty.png", b"")
+            archive.writestr("../escape.txt", b"outside")
+            archive.writestr("assets/../../nested_escape.txt", b"outside too")
+            archive.writestr("/absolute.txt", b"absolute")
+            archive.writestr("./dot/./file.txt", b"dot")
+            archive.writestr("textures\\windows.png", b"backslash")
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_matches_extractall(self) -> None:
+        fast = self.root / "fast"
+        reference = self.root / "reference"
+        extract_archive(self.archive, fast)
+        with zipfile.ZipFile(self.archive) as archive:
+            archive.extractall(reference)
+
+        self.assertEqual(_tree(fast), _tree(reference))
+
+    def test_nested_and_parent_members_stay_inside(self) -> None:
+        destination = self.root / "out" / "pack"
+        extract_archive(self.archive, destination)
+
+        self.assertEqual(
+            (destination / "assets/minecraft/models/item/stick.json").read_bytes(),
+            b'{"parent": "item/generated"}',
+        )
+        self.assertEqual((destination / "escape.txt").read_bytes(), b"outside")
+        self.assertEqual((destination / "assets/nested_escape.txt").read_bytes(), b"outside too")
+        self.assertEqual((destination / "absolute.txt").read_bytes(), b"absolute")
+        self.assertEqual(sorted(path.name for path in (self.root / "out").iterdir()), ["pack"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,10 @@ from .logging import status_message
 from .hashing import hash_model_identifier
 from .file_ops import (
     zip_directory,
+    extract_archive,
+    iter_json_files,
+    write_file,
+    copy_file_contents,
     slugify,
     ensure_directory,
     copy_file_safe,
@@ -14,6 +18,10 @@ __all__ = [
     "status_message",
     "hash_model_identifier",
     "zip_directory",
+    "extract_archive",
+    "iter_json_files",
+    "write_file",
+    "copy_file_contents",
     "slugify",
     "ensure_directory",
     "copy_file_safe",
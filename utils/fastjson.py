@@ -0,0 +1,108 @@
+"""JSON serialization helpers backed by orjson when it is available."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from .file_ops import write_file
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause
+# covers both backends
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse a JSON document, with orjson when it is installed.
+
+    Args:
+        data: UTF-8 encoded bytes or text.
+
+    Returns:
+        The decoded Python object.
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON.
+        UnicodeDecodeError: If the bytes are not valid UTF-8 and orjson is missing
+                            (orjson reports this as a JSONDecodeError).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def load(path: Path) -> Any:
+    """
+    Read and parse a JSON file without decoding it to text first.
+
+    Args:
+        path: JSON file to read.
+
+    Returns:
+        The decoded Python object.
+
+    Raises:
+        JSONDecodeError: If the file is not valid JSON.
+    """
+    return loads(Path(path).read_bytes())
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Uses orjson when installed and falls back to the standard library otherwise.
+    Output is compact unless `pretty` is set, since most generated files are only
+    ever parsed by Bedrock or Geyser.
+
+    Args:
+        obj: JSON-serializable object.
+        pretty: Indent the output with two spaces for debugging.
+
+    Returns:
+        Encoded JSON document as bytes, ready for `Path.write_bytes`.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def dump(obj: Any, path: Path, pretty: bool = False) -> None:
+    """
+    Serialize an object straight into a file.
+
+    With orjson the encoded document is handed to the file in a single write,
+    without an extra write buffer. With the standard library fallback the encoder
+    streams chunks through a 1 MiB write buffer instead of building the whole
+    document as one string first, which keeps peak memory flat for large files.
+
+    Args:
+        obj: JSON-serializable object.
+        path: Destination file, overwritten if it exists.
+        pretty: Indent the output with two spaces for debugging.
+
+    Returns:
+        None. Writes the JSON document to `path`.
+    """
+    if orjson is not None:
+        write_file(path, dumps(obj, pretty=pretty))
+        return
+
+    with open(path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as fp:
+        if pretty:
+            json.dump(obj, fp, indent=2)
+        else:
+            json.dump(obj, fp, separators=(",", ":"))
@@ -7,9 +7,10 @@ import hashlib
 
 def hash_model_identifier(predicate_key: str, model_path: str) -> tuple[str, str]:
     """
-    Compute short MD5 hashes for model identification.
+    Compute short BLAKE2b hashes for model identification.
 
-    Creates shortened hex digests that mimic the Bash `md5sum`-based approach.
+    The digests are only used as identifiers and file name components, so a fast
+    8-byte BLAKE2b digest is used rather than a cryptographic-strength hash.
 
     Args:
         predicate_key: Canonical text representing the predicate tuple 
@@ -17,16 +18,16 @@ def hash_model_identifier(predicate_key: str, model_path: str) -> tuple[str, str
         model_path: Filesystem path used to produce the geometry hash.
 
     Returns:
-        Tuple `(entry_hash, path_hash)` containing the shortened hex digests (7 chars each).
+        Tuple `(entry_hash, path_hash)` containing the hex digests (16 chars each).
     """
-    entry_hash = hashlib.md5(
-        predicate_key.encode("utf-8"), 
-        usedforsecurity=False
-    ).hexdigest()[:7]
-    
-    path_hash = hashlib.md5(
-        model_path.encode("utf-8"), 
-        usedforsecurity=False
-    ).hexdigest()[:7]
-    
+    entry_hash = hashlib.blake2b(
+        predicate_key.encode("utf-8"),
+        digest_size=8,
+    ).hexdigest()
+
+    path_hash = hashlib.blake2b(
+        model_path.encode("utf-8"),
+        digest_size=8,
+    ).hexdigest()
+
     return entry_hash, path_hash
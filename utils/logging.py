@@ -17,6 +17,12 @@ COLOR_THEMES: dict[str, str] = {
 
 MessageLevel = Literal["completion", "process", "critical", "error", "info", "plain"]
 
+# Per level: (writes to stderr, prefix, suffix), rendered once at import time
+_RENDER: dict[str, tuple[bool, str, str]] = {
+    level: (level in {"error", "critical"}, prefix, "\033[0m" if level == "info" else "")
+    for level, prefix in COLOR_THEMES.items()
+}
+
 
 def status_message(level: MessageLevel, message: str) -> None:
     """
@@ -30,10 +36,12 @@ def status_message(level: MessageLevel, message: str) -> None:
     Returns:
         None. Emits directly to stdout/stderr.
     """
-    normalized = level.lower().strip()
-    prefix = COLOR_THEMES.get(normalized, COLOR_THEMES["plain"])
-    suffix = "\033[0m" if normalized == "info" else ""
-    stream = sys.stderr if normalized in {"error", "critical"} else sys.stdout
+    render = _RENDER.get(level)
+    if render is None:
+        render = _RENDER.get(level.lower().strip(), _RENDER["plain"])
+    to_stderr, prefix, suffix = render
+    # Looked up per call so redirected streams are honoured
+    stream = sys.stderr if to_stderr else sys.stdout
     text = message.rstrip("\n")
     stream.write(f"{prefix}{text}{suffix}\n")
     stream.flush()